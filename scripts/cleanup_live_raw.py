@@ -6,10 +6,20 @@ Deletes daily files older than the configured retention window.
 from __future__ import annotations
 
 import argparse
+import os
+import re
 import sys
-from datetime import date, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
+
+# Daily files are named YYYY-MM-DD_<algo>.jsonl. ISO dates sort lexicographically,
+# so the date prefix can be compared as a plain string.
+_DAILY_NAME_RE = re.compile(r"\d{4}-\d{2}-\d{2}_.*\.jsonl\Z")
+
+# Below this many files a thread pool costs more than it saves.
+PARALLEL_UNLINK_MIN = 32
 
 
 def _parse_args() -> argparse.Namespace:
@@ -24,12 +34,39 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def _date_from_filename(path: Path) -> date | None:
+def _iter_algo_dirs(root: Path) -> Iterator[str]:
+    """
+    Yield live/raw/<algo> directory paths, including algo directories that
+    are symlinks to another disk. os.scandir answers is_dir() from the
+    directory listing; only symlinks cost an extra stat.
+    """
+    with os.scandir(root) as algo_it:
+        for algo_entry in algo_it:
+            if algo_entry.is_dir():
+                yield algo_entry.path
+
+
+def _unlink(path: str) -> bool:
     try:
-        date_part = path.stem.split("_", 1)[0]
-        return datetime.strptime(date_part, "%Y-%m-%d").date()
-    except Exception:
-        return None
+        os.unlink(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _bulk_unlink(paths: List[str]) -> List[str]:
+    """
+    Unlink paths, overlapping the syscalls on a thread pool for large sweeps.
+    Returns the paths that were actually removed. All deletions go through
+    here, so a batched backend only needs to replace this function.
+    """
+    if len(paths) < PARALLEL_UNLINK_MIN:
+        results = [_unlink(p) for p in paths]
+    else:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            results = list(ex.map(_unlink, paths))
+    return [p for p, ok in zip(paths, results) if ok]
 
 
 def cleanup_live_raw(data_root: Path, retention_days: int) -> List[Path]:
@@ -39,23 +76,21 @@ def cleanup_live_raw(data_root: Path, retention_days: int) -> List[Path]:
     """
     if retention_days <= 0:
         retention_days = 1
-    cutoff_date = date.today() - timedelta(days=retention_days - 1)
+    cutoff = (date.today() - timedelta(days=retention_days - 1)).isoformat()
     root = Path(data_root) / "live" / "raw"
-    removed: List[Path] = []
     if not root.exists():
-        return removed
-
-    for path in root.glob("*/*.jsonl"):
-        file_date = _date_from_filename(path)
-        if file_date is None:
-            continue
-        if file_date < cutoff_date:
-            try:
-                path.unlink()
-                removed.append(path)
-            except FileNotFoundError:
-                continue
-    return removed
+        return []
+
+    stale: List[str] = []
+    for algo_dir in _iter_algo_dirs(root):
+        # One listing per algo; stale files are picked while it is open.
+        with os.scandir(algo_dir) as it:
+            for entry in it:
+                name = entry.name
+                if not _DAILY_NAME_RE.match(name) or name[:10] >= cutoff:
+                    continue
+                stale.append(entry.path)
+    return [Path(p) for p in _bulk_unlink(stale)]
 
 
 def main() -> int:
@@ -1,18 +1,53 @@
 import json
+import sys
 import argparse
 from pathlib import Path
-from eewpw_parser.config import load_config, config_filename_for_algo
+from eewpw_parser.utils import json_dumps_bytes
+from eewpw_parser.config import load_config, apply_cli_overrides, config_filename_for_algo
 from eewpw_parser.config_loader import set_config_root_override
 from eewpw_parser.parsers.finder.finder_parser import FinderParser
 from eewpw_parser.parsers.vs.vs_parser import VSParser
 from eewpw_parser.schemas import FinalDoc
 
+
+def _write_finaldoc_compact(f, doc: FinalDoc) -> None:
+    """
+    Write a compact FinalDoc one record at a time so the whole JSON document
+    never has to exist in memory. Key order matches FinalDoc.dict().
+    """
+    f.write(b'{"meta":')
+    f.write(json_dumps_bytes(doc.meta.dict()))
+    f.write(b',"annotations":{')
+    for i, (profile, anns) in enumerate(doc.annotations.items()):
+        if i:
+            f.write(b",")
+        f.write(json_dumps_bytes(profile))
+        f.write(b":[")
+        for j, ann in enumerate(anns):
+            if j:
+                f.write(b",")
+            f.write(ann.payload_json())
+        f.write(b"]")
+    f.write(b'},"detections":[')
+    for i, det in enumerate(doc.detections):
+        if i:
+            f.write(b",")
+        f.write(det.payload_json())
+    f.write(b"]}")
+
+
 def main():
     ap = argparse.ArgumentParser(description="EEWPW deterministic parser")
     ap.add_argument("--algo", required=True, choices=["finder", "vs"], help="Algorithm to parse")
     ap.add_argument("--dialect", default=None, help="Dialect (e.g., scfinder)")
     ap.add_argument("--config-root", type=Path, default=None, help="Optional override for configs root")
     ap.add_argument("-v", "--verbose", action="store_true", help="Enable verbose console output")
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parse input files in this many worker processes (Finder only; default 1).",
+    )
     ap.add_argument(
         "--mode",
         choices=["batch", "stream-jsonl"],
@@ -32,10 +67,7 @@ def main():
         set_config_root_override(args.config_root)
 
     cfg_path = config_filename_for_algo(args.algo)
-    cfg = load_config(cfg_path)
-    if args.dialect:
-        cfg["dialect"] = args.dialect
-    cfg["verbose"] = args.verbose
+    cfg = apply_cli_overrides(load_config(cfg_path), args)
     instance = args.instance or f"{args.algo}@unknown"
 
     if args.verbose:
@@ -54,16 +86,22 @@ def main():
         indent = int(cfg.get("output", {}).get("indent", 2))
         ensure_ascii = bool(cfg.get("output", {}).get("ensure_ascii", False))
 
-        with open(args.output, "w", encoding="utf-8") as f:
-            json.dump(doc.dict(), f, indent=indent if pretty else None, ensure_ascii=ensure_ascii)
-        print(f"Wrote {args.output}")
+        with open(args.output, "wb", buffering=1 << 20) as f:
+            if ensure_ascii:
+                f.write(json.dumps(doc.dict(), indent=indent if pretty else None, ensure_ascii=True).encode("utf-8"))
+            elif pretty:
+                # Pretty output is not a hot path; keep the single-pass dump.
+                f.write(json_dumps_bytes(doc.dict(), indent=indent))
+            else:
+                _write_finaldoc_compact(f, doc)
+        sys.stdout.write(f"Wrote {args.output}\n")
     elif args.mode == "stream-jsonl":
         from eewpw_parser.sinks import JsonlStreamSink
 
         out_path = Path(args.output)
         sink = JsonlStreamSink(out_path, algo=args.algo, dialect=cfg.get("dialect"), instance=instance)
         parser.parse(args.inputs, sink=sink)
-        print(f"Streamed JSONL to {out_path}")
+        sys.stdout.write(f"Streamed JSONL to {out_path}\n")
     else:
         raise SystemExit(f"Unsupported mode: {args.mode}")
 
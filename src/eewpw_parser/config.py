@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 import json
 import os
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 from functools import lru_cache
 from pathlib import Path
-from eewpw_parser.config_loader import open_config_json
+from eewpw_parser.config_loader import get_config_path
 
 # -----------------------------------------------------------------------------
 # Canonical filenames for known algorithms. Used to map algo names to config files.
@@ -25,28 +26,89 @@ def config_filename_for_algo(algo: str) -> str:
         raise ValueError(f"Unsupported algo '{algo}'. Supported: {supported}")
 
 
-def load_config(algo_cfg_path: str = "finder.json") -> Dict[str, Any]:
+def _deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Merge b on top of a without mutating either input. Nested dicts are merged
+    key by key; any other value in b replaces the one in a.
+    """
+    if not any(isinstance(v, dict) for v in b.values()):
+        # Flat override (the common case): a single C-level dict merge.
+        return {**a, **b}
+    out = dict(a)
+    stack = [(out, b)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            cur = dst.get(k)
+            if isinstance(v, dict) and isinstance(cur, dict):
+                merged = dict(cur)
+                dst[k] = merged
+                stack.append((merged, v))
+            else:
+                dst[k] = v
+    return out
+
+
+def _read_json(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@lru_cache(maxsize=None)
+def _load_config_cached(global_path: str, algo_path: str) -> Dict[str, Any]:
+    # Keyed on the resolved file paths, so a changed config root (override or
+    # EEWPW_PARSER_CONFIG_ROOT) loads the files it points at.
+    return _deep_merge(_read_json(global_path), _read_json(algo_path))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Read-only copy of a JSON value: dicts become MappingProxyType views and
+    lists become tuples, at every level.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=None)
+def _load_config_frozen(global_path: str, algo_path: str) -> Mapping[str, Any]:
+    return _freeze(_load_config_cached(global_path, algo_path))
+
+
+def load_config(algo_cfg_path: str = "finder.json") -> Mapping[str, Any]:
     """
     Load and merge global and algorithm-specific configuration files.
     configs/global.json is loaded first, then algo_cfg_path is loaded and merged on top.
     These configurations are used to guide the parsing process in the dialect parsers.
+
+    The merged result is cached per process, keyed on the resolved paths of both
+    files, so it follows changes of the config root. The returned mapping is
+    shared and read-only at every level (nested sections are read-only mappings,
+    lists are tuples). Use apply_cli_overrides() to build a per-run config on top.
     """
+    return _load_config_frozen(
+        str(get_config_path("global.json")), str(get_config_path(algo_cfg_path))
+    )
 
-    def _deep_merge(a: Dict[str, Any], b: Dict[str, Any]) -> Dict[str, Any]:
-        out = dict(a)
-        for k, v in b.items():
-            if isinstance(v, dict) and isinstance(out.get(k), dict):
-                out[k] = _deep_merge(out[k], v)
-            else:
-                out[k] = v
-        return out
 
-    g = open_config_json("global.json")
-    a = open_config_json(algo_cfg_path)
-    return _deep_merge(g, a)
+def apply_cli_overrides(cfg_ro: Mapping[str, Any], args: Any) -> Dict[str, Any]:
+    """
+    Build the per-run config from a (read-only) loaded config and parsed CLI args.
+    Only the top level is copied; nested sections stay the cached read-only views.
+    """
+    cfg = dict(cfg_ro)
+    cfg["algo"] = args.algo
+    if args.dialect:
+        cfg["dialect"] = args.dialect
+    cfg["verbose"] = args.verbose
+    if getattr(args, "workers", None):
+        cfg["workers"] = args.workers
+    return cfg
 
 
-@lru_cache(maxsize=None)
 def load_profile(relative_path: str) -> dict:
     """
     Load a profile JSON from the configured configs root.
@@ -60,12 +122,18 @@ def load_profile(relative_path: str) -> dict:
         rel_path = f"profiles/{rel_path}"
 
     try:
-        return open_config_json(rel_path)
+        return _load_profile_cached(str(get_config_path(rel_path)))
     except (FileNotFoundError, json.JSONDecodeError):
         return {}
 
 
-def get_data_root(cfg: Optional[dict]) -> Path:
+@lru_cache(maxsize=None)
+def _load_profile_cached(path: str) -> dict:
+    # Keyed on the resolved path, like _load_config_cached().
+    return _read_json(path)
+
+
+def get_data_root(cfg: Optional[Mapping[str, Any]]) -> Path:
     """
     Resolve the data root used for live outputs.
     Priority:
@@ -76,8 +144,8 @@ def get_data_root(cfg: Optional[dict]) -> Path:
     env_root = os.environ.get("EEWPW_DATA_ROOT")
     if env_root:
         return Path(env_root)
-    live_cfg = (cfg or {}).get("live", {}) if isinstance(cfg, dict) else {}
-    data_root = live_cfg.get("data_root")
+    live_cfg = cfg.get("live") if isinstance(cfg, Mapping) else None
+    data_root = live_cfg.get("data_root") if isinstance(live_cfg, Mapping) else None
     if data_root:
         return Path(data_root)
     return Path.cwd() / "data"
@@ -1,5 +1,6 @@
 import json
 import os
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
 from typing import Optional
@@ -11,6 +12,7 @@ CONFIG_ROOT_OVERRIDE: Optional[Path] = None
 def set_config_root_override(path: Optional[Path]) -> None:
     global CONFIG_ROOT_OVERRIDE
     CONFIG_ROOT_OVERRIDE = path
+    _resolved_config_path.cache_clear()
 
 
 def get_package_config_path(rel_path: str) -> Path:
@@ -22,8 +24,9 @@ def _repo_config_root() -> Optional[Path]:
     return repo_root if repo_root.is_dir() else None
 
 
-def _env_config_root() -> Optional[Path]:
-    env_root = os.environ.get("EEWPW_PARSER_CONFIG_ROOT")
+def _env_config_root(env_root: Optional[str] = None) -> Optional[Path]:
+    if env_root is None:
+        env_root = os.environ.get("EEWPW_PARSER_CONFIG_ROOT")
     if not env_root:
         return None
     root_path = Path(env_root)
@@ -31,12 +34,23 @@ def _env_config_root() -> Optional[Path]:
 
 
 def get_config_path(rel_path: str) -> Path:
+    # The env root is part of the key so a changed EEWPW_PARSER_CONFIG_ROOT is
+    # honoured; set_config_root_override() clears the cache.
+    return _resolved_config_path(rel_path, os.environ.get("EEWPW_PARSER_CONFIG_ROOT") or "")
+
+
+@lru_cache(maxsize=256)
+def _resolved_config_path(rel_path: str, env_root_raw: str) -> Path:
+    """
+    Walk override -> env -> repo -> package and return the first existing path.
+    Cached so each lookup costs its exists() calls only once.
+    """
     if CONFIG_ROOT_OVERRIDE:
         candidate = CONFIG_ROOT_OVERRIDE / rel_path
         if candidate.exists():
             return candidate
 
-    env_root = _env_config_root()
+    env_root = _env_config_root(env_root_raw)
     if env_root:
         candidate = env_root / rel_path
         if candidate.exists():
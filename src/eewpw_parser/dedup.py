@@ -1,42 +1,58 @@
 # -*- coding: utf-8 -*-
-import json
-from typing import List, Set
+import hashlib
+from typing import List, Set, TypeVar
 from pydantic import BaseModel
 
 from eewpw_parser.schemas import Detection, Annotation
+from eewpw_parser.utils import json_dumps_bytes
 
+M = TypeVar("M", bound=BaseModel)
 
-def canonical_json(obj: BaseModel) -> str:
+
+def canonical_json(obj: BaseModel) -> bytes:
     """
-    Produce a deterministic JSON string for a Pydantic model instance.
+    Produce deterministic JSON bytes (sorted keys, compact) for a Pydantic model instance.
     """
-    return json.dumps(
-        obj.dict(),
-        sort_keys=True,
-        ensure_ascii=False,
-        separators=(",", ":"),
-    )
+    return json_dumps_bytes(obj.dict(), sort_keys=True)
 
 
-def deduplicate_detections(detections: List[Detection]) -> List[Detection]:
-    seen: Set[str] = set()
-    unique: List[Detection] = []
-    for d in detections:
-        key = canonical_json(d)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(d)
+def dedup_key(obj: BaseModel) -> bytes:
+    """
+    Fixed-size (16-byte) digest of canonical_json, used as the set key so the
+    seen-set does not hold a full JSON string per record.
+    Detection/Annotation memoize the digest, so repeated dedup passes over the
+    same objects (parser, then FinalDocSink) serialize each one only once.
+    """
+    key = getattr(obj, "_dedup_key", None)
+    if key is None:
+        key = hashlib.blake2b(canonical_json(obj), digest_size=16).digest()
+        if hasattr(obj, "_dedup_key"):
+            obj._dedup_key = key
+    return key
+
+
+def _deduplicate(items: List[M]) -> List[M]:
+    """
+    Keep the first occurrence of each item, preserving order.
+    """
+    seen: Set[bytes] = set()
+    unique: List[M] = []
+    # Bind per-item callables once; this loop runs over every parsed record.
+    seen_add = seen.add
+    unique_append = unique.append
+    key = dedup_key
+    for item in items:
+        # One set probe per item: add() and detect a duplicate by the size not changing.
+        size = len(seen)
+        seen_add(key(item))
+        if len(seen) != size:
+            unique_append(item)
     return unique
 
 
+def deduplicate_detections(detections: List[Detection]) -> List[Detection]:
+    return _deduplicate(detections)
+
+
 def deduplicate_annotations(annotations: List[Annotation]) -> List[Annotation]:
-    seen: Set[str] = set()
-    unique: List[Annotation] = []
-    for a in annotations:
-        key = canonical_json(a)
-        if key in seen:
-            continue
-        seen.add(key)
-        unique.append(a)
-    return unique
+    return _deduplicate(annotations)
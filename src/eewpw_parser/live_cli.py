@@ -2,7 +2,7 @@
 import argparse
 from pathlib import Path
 
-from eewpw_parser.config import load_config, get_data_root, config_filename_for_algo
+from eewpw_parser.config import load_config, apply_cli_overrides, get_data_root, config_filename_for_algo
 from eewpw_parser.config_loader import set_config_root_override
 from eewpw_parser.sources import TailLineSource
 from eewpw_parser.live_engine import LiveEngine
@@ -30,10 +30,7 @@ def main():
         set_config_root_override(args.config_root)
 
     cfg_path = config_filename_for_algo(args.algo)
-    cfg = load_config(cfg_path)
-    if args.dialect:
-        cfg["dialect"] = args.dialect
-    cfg["verbose"] = args.verbose
+    cfg = apply_cli_overrides(load_config(cfg_path), args)
 
     instance = args.instance or f"{args.algo}@unknown"
     dialect = cfg.get("dialect")
@@ -1,13 +1,15 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
+import queue
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 
 from dateutil import parser as dtp
 
 from .schemas import Detection, Annotation, Meta
-from .live_writer import DailyAlgoWriter
+from .live_writer import DailyAlgoWriter, DailyRecord, FLUSH_INTERVAL_S
 
 # Finder streaming
 from .parsers.finder.finder_parser import FinderParser
@@ -15,6 +17,16 @@ from .parsers.finder.dialects import FinderStreamState
 # VS streaming directly through dialect
 from .parsers.vs.dialects import VSDialect, VSStreamState
 
+# Bursts waiting for the background writer; parsing blocks only when the
+# disk falls this many bursts behind.
+WRITE_QUEUE_MAXSIZE = 1024
+# Lines handed to the parser per call when the source has them ready.
+LIVE_BATCH_LINES = 32
+_STOP = object()
+
+# Detections and annotations produced by one input line.
+LineOutput = Tuple[List[Detection], List[Annotation]]
+
 
 class LiveEngine:
     def __init__(
@@ -47,18 +59,63 @@ class LiveEngine:
         self._finder_state: Optional[FinderStreamState] = None
         self._vs_state: Optional[VSStreamState] = None
         self._last_event_id: Optional[str] = None
-        self._started_dt: Optional[datetime] = None
-        self._finished_dt: Optional[datetime] = None
+        # Time bounds as epoch seconds; datetimes are only built at shutdown.
+        self._started_ts: Optional[float] = None
+        self._finished_ts: Optional[float] = None
         self._closed = False
 
+        # Encoded bursts go straight to the writer until run_forever() starts
+        # the background writer thread, then through its queue.
+        self._submit: Callable[[List[DailyRecord]], None] = self._daily_writer.write_many
+        self._write_queue: Optional[queue.Queue] = None
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_error: Optional[BaseException] = None
+
         # annotation profile key per algo
         self._ann_profile = {
             "finder": "time_vs_magnitude",
             "vs": "time_vs_magnitude",
         }.get(self.algo, "annotations")
 
+        # Parser-specific line feeder, resolved once instead of per line.
+        self._feed: Optional[Callable[[List[str]], List[LineOutput]]] = None
+        if isinstance(self.parser, FinderParser):
+            self._finder_state = FinderStreamState()
+            self._feed = self._feed_finder
+        elif isinstance(self.parser, VSDialect):
+            self._vs_state = VSStreamState()
+            self._feed = self._feed_vs
+
+    def _feed_finder(self, lines: List[str]) -> List[LineOutput]:
+        # One parse_stream call per line keeps each output pair in line order,
+        # so annotations are tagged with the event seen just before them.
+        parse_stream = self.parser.parse_stream
+        outputs: List[LineOutput] = []
+        for line in lines:
+            dets, anns, self._finder_state = parse_stream(
+                [line], state=self._finder_state, finalize=False
+            )
+            if dets or anns:
+                outputs.append((dets, anns))
+        return outputs
+
+    def _feed_vs(self, lines: List[str]) -> List[LineOutput]:
+        feed_line = self.parser.feed_line
+        state = self._vs_state
+        outputs: List[LineOutput] = []
+        for line in lines:
+            dets, anns = feed_line(line, state)
+            if dets or anns:
+                outputs.append((dets, anns))
+        return outputs
+
     def _parse_ts(self, ts_iso: str) -> datetime:
-        dt = dtp.parse(ts_iso)
+        # Timestamps come from to_iso_utc_z/epoch_to_iso_z, so the C-level
+        # fromisoformat handles them; dateutil is kept for anything unusual.
+        try:
+            dt = datetime.fromisoformat(ts_iso.replace("Z", "+00:00"))
+        except ValueError:
+            dt = dtp.parse(ts_iso)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         else:
@@ -66,37 +123,120 @@ class LiveEngine:
         return dt
 
     def _update_time_bounds(self, ts_iso: str) -> None:
-        dt = self._parse_ts(ts_iso)
-        if self._started_dt is None or dt < self._started_dt:
-            self._started_dt = dt
-        if self._finished_dt is None or dt > self._finished_dt:
-            self._finished_dt = dt
-
-    def _emit(self, dets: List[Detection], anns: List[Annotation]) -> None:
-        for det in dets:
-            self._update_time_bounds(det.timestamp)
-            self._last_event_id = str(det.event_id)
-            self._daily_writer.write_detection(det)
-        for ann in anns:
-            self._update_time_bounds(ann.timestamp)
-            eid = self._last_event_id or ""
-            self._daily_writer.write_annotation(self._ann_profile, ann, eid)
+        ts = self._parse_ts(ts_iso).timestamp()
+        if self._started_ts is None or ts < self._started_ts:
+            self._started_ts = ts
+        if self._finished_ts is None or ts > self._finished_ts:
+            self._finished_ts = ts
+
+    @staticmethod
+    def _format_ts(ts: Optional[float]) -> Optional[str]:
+        if ts is None:
+            return None
+        return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    def _start_writer_thread(self) -> None:
+        if self._writer_thread is not None:
+            return
+        q: queue.Queue = queue.Queue(maxsize=WRITE_QUEUE_MAXSIZE)
+        t = threading.Thread(target=self._writer_loop, args=(q,), name="eewpw-live-writer", daemon=True)
+        self._write_queue = q
+        self._writer_thread = t
+        t.start()
+        self._submit = q.put
+
+    def _stop_writer_thread(self) -> None:
+        t = self._writer_thread
+        if t is None:
+            return
+        if t.is_alive():
+            self._write_queue.put(_STOP)
+            t.join()
+        self._writer_thread = None
+        self._write_queue = None
+        self._submit = self._daily_writer.write_many
+
+    def _writer_loop(self, q: queue.Queue) -> None:
+        writer = self._daily_writer
+        stop = False
+        while not stop:
+            try:
+                batch = q.get(timeout=FLUSH_INTERVAL_S)
+            except queue.Empty:
+                # Idle feed: push out the tail of the last burst.
+                if self._writer_error is None:
+                    try:
+                        writer.flush()
+                    except BaseException as exc:
+                        self._writer_error = exc
+                continue
+            if batch is _STOP:
+                break
+            records = list(batch)
+            # Coalesce whatever else is already queued into the same write.
+            while True:
+                try:
+                    more = q.get_nowait()
+                except queue.Empty:
+                    break
+                if more is _STOP:
+                    stop = True
+                    break
+                records.extend(more)
+            if self._writer_error is not None:
+                # Keep draining so the parser never blocks on a dead writer.
+                continue
+            try:
+                writer.write_many(records)
+            except BaseException as exc:
+                self._writer_error = exc
+
+    def _emit(self, outputs: List[LineOutput]) -> None:
+        if not outputs:
+            return
+        if self._writer_error is not None:
+            raise self._writer_error
+        t = self._writer_thread
+        if t is not None and not t.is_alive():
+            # Nothing would ever drain the queue; fail instead of blocking.
+            raise RuntimeError("live writer thread stopped unexpectedly")
+        # Encode the whole burst first, then hand it to the writer as one batch.
+        writer = self._daily_writer
+        update_bounds = self._update_time_bounds
+        detection_record = writer.detection_record
+        annotation_record = writer.annotation_record
+        profile = self._ann_profile
+        records: List[DailyRecord] = []
+        append = records.append
+        for dets, anns in outputs:
+            if dets:
+                for det in dets:
+                    update_bounds(det.timestamp)
+                    append(detection_record(det))
+                self._last_event_id = str(dets[-1].event_id)
+            if anns:
+                # Annotations attach to the most recent event; resolve it once per line.
+                eid = self._last_event_id or ""
+                for ann in anns:
+                    update_bounds(ann.timestamp)
+                    append(annotation_record(profile, ann, eid))
+        if records:
+            self._submit(records)
 
     def run_forever(self) -> None:
         try:
-            # Initialize parser state according to the provided parser/dialect.
-            if isinstance(self.parser, FinderParser):
-                self._finder_state = self._finder_state or FinderStreamState()
-                for line in self.source:
-                    dets, anns, self._finder_state = self.parser.parse_stream([line], state=self._finder_state, finalize=False)
-                    self._emit(dets, anns)
-            elif isinstance(self.parser, VSDialect):
-                self._vs_state = self._vs_state or VSStreamState()
-                for line in self.source:
-                    d, a = self.parser.feed_line(line, self._vs_state)
-                    self._emit(d, a)
-            else:
+            feed = self._feed
+            if feed is None:
                 raise ValueError("Unsupported parser type for live engine")
+            self._start_writer_thread()
+            emit = self._emit
+            source = self.source
+            if hasattr(source, "iter_batches"):
+                batches = source.iter_batches(LIVE_BATCH_LINES)
+            else:
+                batches = ([line] for line in source)
+            for batch in batches:
+                emit(feed(batch))
         finally:
             self.shutdown()
 
@@ -109,23 +249,32 @@ class LiveEngine:
                 if self._finder_state is None:
                     self._finder_state = FinderStreamState()
                 dets, anns, self._finder_state = self.parser.parse_stream([], state=self._finder_state, finalize=True)
-                self._emit(dets, anns)
+                self._emit([(dets, anns)])
             elif isinstance(self.parser, VSDialect):
                 if self._vs_state is None:
                     self._vs_state = VSStreamState()
                 d, a = self.parser.flush(self._vs_state)
-                self._emit(d, a)
+                self._emit([(d, a)])
         finally:
-            meta = Meta(
-                algo=self.algo,
-                dialect=self.dialect,
-                files=None,
-                started_at=self._started_dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ") if self._started_dt else None,
-                finished_at=self._finished_dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ") if self._finished_dt else None,
-                playback_time=None,
-                extras={},
-                stats_total={},
-            )
-            self._daily_writer.write_meta(meta)
-            self._daily_writer.close()
-            self._closed = True
+            # Drain the background writer and push buffered records out before
+            # the meta line, even if the final parser flush above raised.
+            try:
+                self._stop_writer_thread()
+                self._daily_writer.flush()
+                meta = Meta(
+                    algo=self.algo,
+                    dialect=self.dialect,
+                    files=None,
+                    started_at=self._format_ts(self._started_ts),
+                    finished_at=self._format_ts(self._finished_ts),
+                    playback_time=None,
+                    extras={},
+                    stats_total={},
+                )
+                self._daily_writer.write_meta(meta)
+            finally:
+                # A failing disk must not leave the daily file open.
+                self._daily_writer.close()
+                self._closed = True
+        if self._writer_error is not None:
+            raise self._writer_error
@@ -1,18 +1,114 @@
 # -*- coding: utf-8 -*-
 from __future__ import annotations
-import json
-from datetime import timezone
+import io
+import os
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import BinaryIO, Dict, Optional, Sequence, Tuple
 
 from dateutil import parser as dtp
 
 from .schemas import Detection, Annotation, Meta
 from .config import get_live_raw_dir, get_live_daily_jsonl_path
-from .utils import to_iso_utc_z
+from .utils import json_dumps_bytes, to_iso_utc_z
 
+# Flush policy: records are buffered and pushed to the OS after this many
+# lines or this many seconds, whichever comes first, and always on close().
+FLUSH_EVERY_LINES = 64
+FLUSH_INTERVAL_S = 0.25
+WRITE_BUFFER_SIZE = 1 << 16
+# Daily files are write-once; every this many flushes the kernel is told it
+# may drop their cached pages (no-op where posix_fadvise is unavailable).
+DROP_CACHE_EVERY_FLUSHES = 16
 
-class LiveWriter:
+_RECORD_TYPES = ("detection", "annotation", "meta")
+
+# (day bucket 'YYYY-MM-DD', record_type, timestamp, encoded JSONL line)
+DailyRecord = Tuple[str, str, str, bytes]
+
+
+def _record_prefixes(algo: str, dialect: str, instance: str) -> Dict[str, bytes]:
+    """
+    Encoded constant head of each record type, e.g.
+    b'{"record_type":"detection","algo":...,"instance":"..."', left open so
+    the per-record keys and the payload can be appended as bytes.
+    """
+    return {
+        rt: json_dumps_bytes(
+            {"record_type": rt, "algo": algo, "dialect": dialect, "instance": instance}
+        )[:-1]
+        for rt in _RECORD_TYPES
+    }
+
+
+def _open_append(path: Path) -> BinaryIO:
+    """
+    Open path for buffered binary appends straight on a raw fd (no
+    TextIOWrapper layer). O_NOATIME is used when the platform has it and we
+    own the file; it is dropped if the kernel refuses it.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    flags |= getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+    noatime = getattr(os, "O_NOATIME", 0)
+    try:
+        fd = os.open(path, flags | noatime, 0o666)
+    except PermissionError:
+        if not noatime:
+            raise
+        fd = os.open(path, flags, 0o666)
+    return io.BufferedWriter(io.FileIO(fd, mode="a", closefd=True), buffer_size=WRITE_BUFFER_SIZE)
+
+
+def _fadvise(fh: BinaryIO, advice_name: str) -> None:
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fh.fileno(), 0, 0, advice)
+    except OSError:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _profile_member(profile: str) -> bytes:
+    return b',"profile":' + json_dumps_bytes(profile)
+
+
+class _BatchedFlush:
+    """
+    Count/time based flushing shared by the live writers, so a burst of small
+    records costs one write() syscall instead of one per line.
+    """
+
+    _fh: Optional[BinaryIO]
+
+    def _init_flush_policy(self) -> None:
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._flush_every = FLUSH_EVERY_LINES
+        self._flush_interval = FLUSH_INTERVAL_S
+
+    def _note_write(self, n: int = 1) -> None:
+        self._pending += n
+        if self._pending >= self._flush_every:
+            self.flush()
+            return
+        now = time.monotonic()
+        if now - self._last_flush >= self._flush_interval:
+            self.flush(now)
+
+    def flush(self, now: Optional[float] = None) -> None:
+        if self._fh is not None and self._pending:
+            self._fh.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic() if now is None else now
+
+
+class LiveWriter(_BatchedFlush):
     """
     Legacy per-event writer kept for older tests; new live output flows use DailyAlgoWriter.
     """
@@ -23,47 +119,50 @@ class LiveWriter:
         self.dialect = dialect
         self.instance = instance
         self.verbose = verbose
-        self._fh = self.path.open("a", encoding="utf-8")
-
-    def _write_line(self, record_type: str, payload: dict, profile: Optional[str] = None) -> None:
-        obj = {
-            "record_type": record_type,
-            "algo": self.algo,
-            "dialect": self.dialect,
-            "instance": self.instance,
-            "payload": payload,
-        }
-        if profile is not None:
-            obj["profile"] = profile
-        line = json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
-        self._fh.write(line)
-        self._fh.flush()
-        if self.verbose:
-            ts = (
-                payload.get("timestamp")
-                or payload.get("orig_time")
-                or payload.get("started_at")
-                or "-"
+        self._prefixes = _record_prefixes(algo, dialect, instance)
+        self._fh = _open_append(self.path)
+        self._init_flush_policy()
+
+    def _write_line(
+        self,
+        record_type: str,
+        payload_json: bytes,
+        ts: Optional[str],
+        profile: Optional[str] = None,
+    ) -> None:
+        self._fh.write(
+            b"".join(
+                (
+                    self._prefixes[record_type],
+                    _profile_member(profile) if profile is not None else b"",
+                    b',"payload":',
+                    payload_json,
+                    b"}\n",
+                )
             )
-            print(f"[live-writer] {record_type} @ {ts} -> {self.path}", flush=True)
+        )
+        self._note_write()
+        if self.verbose:
+            print(f"[live-writer] {record_type} @ {ts or '-'} -> {self.path}", flush=True)
 
     def write_detection(self, det: Detection) -> None:
-        self._write_line("detection", det.dict())
+        self._write_line("detection", det.payload_json(), det.timestamp)
 
     def write_annotation(self, profile: str, ann: Annotation) -> None:
-        self._write_line("annotation", ann.dict(), profile=profile)
+        self._write_line("annotation", ann.payload_json(), ann.timestamp, profile=profile)
 
     def write_meta(self, meta: Meta) -> None:
-        self._write_line("meta", meta.dict())
+        self._write_line("meta", json_dumps_bytes(meta.dict()), meta.started_at)
 
     def close(self) -> None:
         try:
+            self.flush()
             self._fh.close()
         except Exception:
             pass
 
 
-class DailyAlgoWriter:
+class DailyAlgoWriter(_BatchedFlush):
     """
     Rolling daily writer that appends all records for a given algo into
     data_root/live/raw/<algo>/<YYYY-MM-DD>_<algo>.jsonl
@@ -77,78 +176,116 @@ class DailyAlgoWriter:
         self.verbose = verbose
         self._dir = get_live_raw_dir(self.data_root, self.algo)
         self._current_date: Optional[str] = None
-        self._fh: Optional[TextIO] = None
+        self._fh: Optional[BinaryIO] = None
+        self._path: Optional[Path] = None
+        self._prefixes = _record_prefixes(algo, dialect, instance)
+        self._flushes = 0
+        self._init_flush_policy()
+
+    def flush(self, now: Optional[float] = None) -> None:
+        wrote = self._fh is not None and self._pending > 0
+        super().flush(now)
+        if wrote:
+            self._flushes += 1
+            if self._flushes % DROP_CACHE_EVERY_FLUSHES == 0:
+                _fadvise(self._fh, "POSIX_FADV_DONTNEED")
 
     def _ensure_handle(self, date_str: str) -> None:
         if self._current_date == date_str and self._fh:
             return
         if self._fh:
             try:
+                self.flush()
                 self._fh.close()
             except Exception:
                 pass
         path = get_live_daily_jsonl_path(self.data_root, self.algo, date_str)
         path.parent.mkdir(parents=True, exist_ok=True)
-        self._fh = path.open("a", encoding="utf-8")
+        self._fh = _open_append(path)
+        _fadvise(self._fh, "POSIX_FADV_SEQUENTIAL")
+        self._path = path
         self._current_date = date_str
         if self.verbose:
             print(f"[live-writer] open {path}", flush=True)
 
-    def _write_line(
+    def _encode(
         self,
         record_type: str,
-        payload: dict,
+        payload_json: bytes,
         timestamp_iso: str,
         event_id: str,
         profile: Optional[str],
-    ) -> None:
-        if self._fh is None:
-            raise RuntimeError("Writer handle not initialized")
-        obj = {
-            "record_type": record_type,
-            "algo": self.algo,
-            "dialect": self.dialect,
-            "instance": self.instance,
-            "event_id": event_id,
-            "timestamp": timestamp_iso,
-            "payload": payload,
-        }
-        if profile is not None:
-            obj["profile"] = profile
-        line = json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n"
-        self._fh.write(line)
-        self._fh.flush()
-        if self.verbose:
-            print(f"[live-writer] {record_type} @ {timestamp_iso} -> {self._fh.name}", flush=True)
+    ) -> DailyRecord:
+        line = b"".join(
+            (
+                self._prefixes[record_type],
+                b',"event_id":',
+                json_dumps_bytes(event_id),
+                b',"timestamp":',
+                json_dumps_bytes(timestamp_iso),
+                _profile_member(profile) if profile is not None else b"",
+                b',"payload":',
+                payload_json,
+                b"}\n",
+            )
+        )
+        return (self._date_from_iso(timestamp_iso), record_type, timestamp_iso, line)
 
     def _date_from_iso(self, ts_iso: str) -> str:
-        dt = dtp.parse(ts_iso)
+        # Record timestamps come from to_iso_utc_z/epoch_to_iso_z
+        # ('YYYY-MM-DDTHH:MM:SS[.ffffff]Z'), so the UTC day is just the prefix.
+        if len(ts_iso) >= 11 and ts_iso[4] == "-" and ts_iso[7] == "-" and ts_iso[-1] == "Z":
+            return ts_iso[:10]
+        try:
+            dt = datetime.fromisoformat(ts_iso.replace("Z", "+00:00"))
+        except ValueError:
+            dt = dtp.parse(ts_iso)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         else:
             dt = dt.astimezone(timezone.utc)
         return dt.strftime("%Y-%m-%d")
 
+    def detection_record(self, det: Detection) -> DailyRecord:
+        return self._encode("detection", det.payload_json(), det.timestamp, str(det.event_id), None)
+
+    def annotation_record(self, profile: str, ann: Annotation, event_id: str) -> DailyRecord:
+        return self._encode("annotation", ann.payload_json(), ann.timestamp, event_id, profile)
+
+    def write_many(self, records: Sequence[DailyRecord]) -> None:
+        """
+        Append records built by detection_record/annotation_record, issuing a
+        single write() per run of records that land in the same daily file.
+        """
+        for date_str, group in groupby(records, key=itemgetter(0)):
+            chunk = list(group)
+            # Same day as the open file is the steady state; only rollover
+            # (or the first record) takes the _ensure_handle cold path.
+            if date_str != self._current_date or self._fh is None:
+                self._ensure_handle(date_str)
+            self._fh.write(b"".join([r[3] for r in chunk]))
+            self._note_write(len(chunk))
+            if self.verbose:
+                for _, record_type, timestamp_iso, _ in chunk:
+                    print(f"[live-writer] {record_type} @ {timestamp_iso} -> {self._path}", flush=True)
+
     def write_detection(self, det: Detection) -> None:
-        ts_iso = det.timestamp
-        date_str = self._date_from_iso(ts_iso)
-        self._ensure_handle(date_str)
-        self._write_line("detection", det.dict(), ts_iso, str(det.event_id), None)
+        self.write_many((self.detection_record(det),))
 
     def write_annotation(self, profile: str, ann: Annotation, event_id: str) -> None:
-        ts_iso = ann.timestamp
-        date_str = self._date_from_iso(ts_iso)
-        self._ensure_handle(date_str)
-        self._write_line("annotation", ann.dict(), ts_iso, event_id, profile)
+        self.write_many((self.annotation_record(profile, ann, event_id),))
 
     def write_meta(self, meta: Meta) -> None:
         ts_iso = meta.started_at or meta.finished_at or to_iso_utc_z("1970-01-01T00:00:00Z")
-        date_str = self._date_from_iso(ts_iso)
-        self._ensure_handle(date_str)
-        self._write_line("meta", meta.dict(), ts_iso, "", None)
+        self.write_many((self._encode("meta", json_dumps_bytes(meta.dict()), ts_iso, "", None),))
 
     def close(self) -> None:
         if self._fh:
+            # Close the handle even when the final flush fails.
+            try:
+                self.flush()
+            except Exception:
+                pass
             try:
                 self._fh.close()
             except Exception:
@@ -1,16 +1,106 @@
 # -*- coding: utf-8 -*-
+import io
 import re
 from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.context import BaseContext
 from dataclasses import dataclass, field
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Iterable, Iterator, Optional
 from eewpw_parser.schemas import Detection, DetectionCore, FaultVertex, GMObs, Annotation
-from eewpw_parser.utils import to_iso_utc_z, epoch_to_iso_z, trim
+from eewpw_parser.utils import to_iso_utc_z, epoch_to_iso_z, required_literal
 from eewpw_parser.config import load_profile
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # optional speedup, see the "fast" extra
+    lxml_etree = None
+
 
 FINDER_RECENT_LINES_MAX = 2000
+# ASCII characters other than \n that str.splitlines() also breaks on.
+_NON_LF_BREAKS = "\r\x0b\x0c\x1c\x1d\x1e"
+
+
+def _read_log_lines(path: str) -> List[str]:
+    """
+    Read and split a whole log file in one go, with the same decoding and
+    newline handling as iterating it in text mode.
+    """
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8", errors="ignore")
+    # Plain ASCII with only \n breaks (the usual case) splits identically
+    # with str.splitlines, skipping the newline-translating copy.
+    if text.isascii() and not any(c in text for c in _NON_LF_BREAKS):
+        return text.splitlines(keepends=True)
+    return io.StringIO(text, newline=None).readlines()
+
+
+def _xml_from_pieces(pieces: Iterable[str]):
+    """
+    Parse an XML document given as consecutive string pieces (e.g. log
+    lines) by feeding them to an incremental parser, so the document is
+    never joined into one string. Uses lxml when installed and
+    xml.etree.ElementTree otherwise; both trees support the find/findall/
+    findtext/attrib subset the ShakeAlert dialect uses.
+    """
+    if lxml_etree is not None:
+        parser = lxml_etree.XMLParser(resolve_entities=False, no_network=True)
+    else:
+        parser = ET.XMLParser()
+    for piece in pieces:
+        parser.feed(piece)
+    return parser.close()
+
+
+def _parse_file_in_worker(
+    dialect_cls: type, path: str, verbose: bool, profile: dict
+) -> Tuple[List[Detection], List[Annotation], Dict[str, Any]]:
+    """
+    FinderBaseDialect.parse_files() process-pool entry point. The profile is
+    the one resolved in the parent, so workers started with "spawn" (which do
+    not inherit a config root override) use the same patterns.
+    """
+    worker = dialect_cls()
+    worker.verbose = verbose
+    worker._profile_cache = profile
+    return worker.parse_file(path)
+
+
+def _station_obs(stations: List[tuple]) -> List[GMObs]:
+    """
+    PGA GMObs per (lat, lon, sncl, t_epoch, pga) station tuple from a Finder
+    station block. Fields are given as the str values validation would
+    produce, so the observations are built with construct().
+    """
+    construct = GMObs.construct
+    to_iso = epoch_to_iso_z
+    return [
+        construct(
+            orig_sys="finder",
+            SNCL=sncl,
+            value=str(pga),
+            lat=str(lat),
+            lon=str(lon),
+            time=to_iso(t_epoch),
+        )
+        for lat, lon, sncl, t_epoch, pga in stations
+    ]
+
+
+def _fault_vertices(coords: List[Tuple[str, str, str]]) -> List[FaultVertex]:
+    """
+    FaultVertex per (lat, lon, depth) string triple. Values go through
+    float() and back to str exactly as field validation would, so the
+    vertices are built with construct() instead of validating each one.
+    """
+    construct = FaultVertex.construct
+    return [
+        construct(lat=str(float(a)), lon=str(float(b)), depth=str(float(c)))
+        for a, b, c in coords
+    ]
 
 
 @dataclass
@@ -39,14 +129,22 @@ class FinderBaseDialect:
     Designed for complete files (offline). Multiple files can be merged by the orchestrator.
     """
 
-    # Core patterns
+    # Core patterns. The detection walk tests a plain substring ("event_id",
+    # "get_rupture_list", "threshold") before running the matching regex, so
+    # keep those literals in any override.
     P_EVENT_ID = re.compile(r"\bevent_id\s*=\s*(\d+)")
-    P_GET_MAG = re.compile(r"->\s*get_mag\s*=\s*([0-9.]+)")
-    P_GET_LAT = re.compile(r"->\s*get_epicenter_lat\s*=\s*(-?[0-9.]+)")
-    P_GET_LON = re.compile(r"->\s*get_epicenter_lon\s*=\s*(-?[0-9.]+)")
-    P_GET_DEP = re.compile(r"->\s*get_depth\s*=\s*([0-9.]+)")
-    P_GET_LIK = re.compile(r"->\s*get_likelihood\s*=\s*([0-9.]+)")
-    P_GET_OTM = re.compile(r"->\s*get_origin_time\s*=\s*([0-9\.e\+\-]+)")
+    # All "-> get_<field> = <value>" scalars in one pass; the named group that
+    # matched (m.lastgroup) says which field it was.
+    P_GET_ANY = re.compile(
+        r"->\s*get_(?:"
+        r"mag\s*=\s*(?P<mag>[0-9.]+)"
+        r"|epicenter_lat\s*=\s*(?P<lat>-?[0-9.]+)"
+        r"|epicenter_lon\s*=\s*(?P<lon>-?[0-9.]+)"
+        r"|depth\s*=\s*(?P<dep>[0-9.]+)"
+        r"|likelihood\s*=\s*(?P<lik>[0-9.]+)"
+        r"|origin_time\s*=\s*(?P<otm>[0-9\.e\+\-]+)"
+        r")"
+    )
     P_GET_AZM = re.compile(r"->\s*get_azimuth\s*=\s*([0-9.]+)")
     P_GET_RUP = re.compile(r"get_rupture_list\s*=\s*(.*)")
     P_RUP_PT  = re.compile(r"([-\d.]+)\/([-\d.]+)\/([-\d.]+)")
@@ -87,6 +185,9 @@ class FinderBaseDialect:
         r"(?:\[[^\]]*\]\s*|\|\s*[^|]*\|\s*)?"  # optional [notice/Application] or '| INFO |' block
         r"(.*)$"                               # 2: rest of line (message)
     )
+    # P_PREFIX_TS only matches lines that start with a 4-digit year, so the
+    # walks skip lines failing line[:4].isdigit() without running it.
+    PREFIX_TS_YEAR_FIRST: bool = True
 
     # The dialect parser profile JSON
     PROFILE_NAME: str = "profiles/finder_time_vs_mag.json"
@@ -101,6 +202,73 @@ class FinderBaseDialect:
             self._profile_cache = load_profile(self.PROFILE_NAME)
         return self._profile_cache
 
+    @property
+    def _annotation_patterns(self) -> Tuple[Tuple[str, str, "re.Pattern[str]", Optional[str], bool], ...]:
+        """
+        Profile annotation patterns as (pattern_id, pattern, compiled, anchor,
+        gated) tuples, compiled once per dialect instance. anchor is a literal
+        every match must contain (see utils.required_literal) and lets most
+        lines be rejected with a substring test. Patterns without an anchor are
+        gated by _annotation_gate when possible. timestamp_regex is skipped.
+        """
+        if not hasattr(self, "_annotation_patterns_cache"):
+            compiled = [
+                (pid, pat, re.compile(pat), required_literal(pat))
+                for pid, pat in self.profile.get("patterns", {}).items()
+                if pid != "timestamp_regex"
+            ]
+            # Group-free patterns can be alternated safely (no backreferences
+            # to renumber); a single one gains nothing from a gate.
+            gated = [
+                pat for _, pat, rx, anchor in compiled
+                if anchor is None and rx.groups == 0
+            ]
+            gate = None
+            if len(gated) > 1:
+                try:
+                    gate = re.compile("|".join("(?:%s)" % pat for pat in gated))
+                except re.error:
+                    gate = None
+            self._annotation_gate = gate
+            self._annotation_patterns_cache = tuple(
+                (pid, pat, rx, anchor, gate is not None and anchor is None and rx.groups == 0)
+                for pid, pat, rx, anchor in compiled
+            )
+        return self._annotation_patterns_cache
+
+    def _matching_patterns(self, line: str) -> Iterator[Tuple[str, str]]:
+        """
+        (pattern_id, pattern) of every profile annotation pattern that matches
+        line, in profile order. Anchored patterns are prefiltered with a
+        substring test; gated ones share a single _annotation_gate pass.
+        """
+        patterns = self._annotation_patterns
+        gate = self._annotation_gate
+        gate_hit = None
+        for pid, pat, rx, anchor, gated in patterns:
+            if anchor is not None:
+                if anchor not in line:
+                    continue
+            elif gated:
+                # One alternation pass decides for every gated pattern.
+                if gate_hit is None:
+                    gate_hit = gate.search(line) is not None
+                if not gate_hit:
+                    continue
+            if rx.search(line):
+                yield pid, pat
+
+    @property
+    def _playback_anchor(self) -> str:
+        """
+        Literal every START_PLAYBACK_RE match contains ("" when there is none),
+        used as an `in` prefilter before running the playback regex.
+        """
+        if not hasattr(self, "_playback_anchor_cache"):
+            rx = self.START_PLAYBACK_RE
+            self._playback_anchor_cache = (required_literal(rx.pattern) if rx is not None else None) or ""
+        return self._playback_anchor_cache
+
 
     def parse_file(self, path: str, algo: str = "finder", dialect: str = "scfinder") -> Tuple[List[Detection], List[Annotation], Dict[str, Any]]:
         """
@@ -125,29 +293,55 @@ class FinderBaseDialect:
             }
         }
         """
-        dets: List[Detection] = []
-        ann: List[Annotation] = []
-        state = FinderStreamState()
+        return self._parse_lines(path, _read_log_lines(path))
+
+    def parse_files(
+        self,
+        paths: List[str],
+        max_workers: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> Iterator[Tuple[List[Detection], List[Annotation], Dict[str, Any]]]:
+        """
+        Parse several files, yielding parse_file() results in input order.
 
-        # Single-pass streaming parse to stay real-time friendly
-        batch: List[str] = []
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                batch.append(line)
-                if len(batch) >= 500:
-                    d, a, state = self.parse_stream(batch, state, finalize=False)
-                    dets.extend(d)
-                    ann.extend(a)
-                    batch = []
-
-        if batch:
-            d, a, state = self.parse_stream(batch, state, finalize=False)
-            dets.extend(d)
-            ann.extend(a)
-
-        d, a, state = self.parse_stream([], state, finalize=True)
-        dets.extend(d)
-        ann.extend(a)
+        With max_workers > 1 the files are parsed in that many worker
+        processes (files share no parser state; mp_context selects the start
+        method). Otherwise they are parsed here, with the next file read on a
+        helper thread while the current one is parsed, so disk reads overlap
+        with parsing.
+        """
+        if len(paths) < 2:
+            for path in paths:
+                yield self.parse_file(path)
+            return
+
+        if max_workers is not None and max_workers > 1:
+            n = len(paths)
+            with ProcessPoolExecutor(max_workers=min(max_workers, n), mp_context=mp_context) as pool:
+                yield from pool.map(
+                    _parse_file_in_worker,
+                    [type(self)] * n,
+                    paths,
+                    [self.verbose] * n,
+                    [self.profile] * n,
+                )
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pending = pool.submit(_read_log_lines, paths[0])
+            for k, path in enumerate(paths):
+                lines = pending.result()
+                if k + 1 < len(paths):
+                    pending = pool.submit(_read_log_lines, paths[k + 1])
+                yield self._parse_lines(path, lines)
+
+    def _parse_lines(self, path: str, lines: List[str]) -> Tuple[List[Detection], List[Annotation], Dict[str, Any]]:
+        """
+        parse_file() body for an already-read file.
+        """
+        # The whole file is already in memory, so it goes through the
+        # streaming state machine in a single finalizing call.
+        dets, ann, state = self.parse_stream(lines, FinderStreamState(), finalize=True)
 
         # Build per-file extras block
         extras: Dict[str, Any] = {
@@ -212,11 +406,18 @@ class FinderBaseDialect:
         state.line_offset to emit absolute line numbers.
         """
         ann: List[Annotation] = []
-        patterns_cfg = self.profile.get("patterns", {})
+        matching_patterns = self._matching_patterns
+
+        prefix_ts = self.P_PREFIX_TS.match
+        year_first = self.PREFIX_TS_YEAR_FIRST
+        playback_re = self.START_PLAYBACK_RE
+        playback_anchor = self._playback_anchor
 
         for idx, line in enumerate(lines):
+            if year_first and not line[:4].isdigit():
+                continue
             absolute_line = state.line_offset + idx + 1
-            m = self.P_PREFIX_TS.search(line)
+            m = prefix_ts(line)
             if not m:
                 continue
 
@@ -229,24 +430,22 @@ class FinderBaseDialect:
 
             if (
                 state.playback_time_iso is None
-                and self.START_PLAYBACK_RE
-                and self.START_PLAYBACK_RE.search(line)
+                and playback_re
+                and playback_anchor in line
+                and playback_re.match(line)
             ):
                 state.playback_time_iso = ts_iso
 
-            for pid, pat in patterns_cfg.items():
-                if pid == "timestamp_regex":
-                    continue
-                if re.search(pat, line):
-                    ann.append(
-                        Annotation(
-                            timestamp=ts_iso,
-                            pattern=pat,
-                            line=absolute_line,
-                            text=line.rstrip("\n"),
-                            pattern_id=pid,
-                        )
+            for pid, pat in matching_patterns(line):
+                ann.append(
+                    Annotation(
+                        timestamp=ts_iso,
+                        pattern=pat,
+                        line=absolute_line,
+                        text=line.rstrip("\n"),
+                        pattern_id=pid,
                     )
+                )
 
         return ann
 
@@ -263,45 +462,45 @@ class FinderBaseDialect:
         prefix remain buffered for the next call.
         """
         dets: List[Detection] = []
+        # Hoisted out of the per-line loop.
+        n_lines = len(lines)
+        station_header = self.P_STATION_HEADER.search
+        station_rows = self.P_STATION_ROW.findall
+        event_id_search = self.P_EVENT_ID.search
+        prefix_ts = self.P_PREFIX_TS.match
+        year_first = self.PREFIX_TS_YEAR_FIRST
+        get_any = self.P_GET_ANY.finditer
+        get_rupture = self.P_GET_RUP.search
+        rupture_points = self.P_RUP_PT.findall
+        rupture_line = self.P_RUP_LINE.match
+
         i = 0
         pending_station_list = state.pending_station_list
         version_by_event = state.version_by_event
 
-        while i < len(lines):
+        while i < n_lines:
             line = lines[i]
 
             # Station block capture; if the block is incomplete and we're not
             # finalizing, keep it buffered for the next call.
-            if self.P_STATION_HEADER.search(line):
+            if "threshold" in line and station_header(line):
                 j = i + 1
                 stations = []
-                while j < len(lines):
-                    mrow = self.P_STATION_ROW.findall(lines[j])
+                while j < n_lines:
+                    mrow = station_rows(lines[j])
                     if not mrow:
                         break
-                    for match in mrow:
-                        sta, lat, lon, pga, t_epoch, include = (
-                            match[0],
-                            match[1],
-                            match[2],
-                            match[3],
-                            match[4],
-                            match[5],
-                        )
-                        if int(include) == 1:
-                            stations.append(
-                                (
-                                    float(lat),
-                                    float(lon),
-                                    trim(sta),
-                                    float(t_epoch),
-                                    float(pga),
-                                )
-                            )
+                    # include is a single digit; only included rows pay
+                    # for the float conversions.
+                    stations.extend(
+                        (float(lat), float(lon), sta.strip(), float(t_epoch), float(pga))
+                        for sta, lat, lon, pga, t_epoch, include in mrow
+                        if include == "1"
+                    )
                     j += 1
 
-                if not finalize and j >= len(lines) and (
-                    j == len(lines) or self.P_STATION_ROW.findall(lines[-1])
+                if not finalize and j >= n_lines and (
+                    j == n_lines or station_rows(lines[-1])
                 ):
                     state.pending_station_list = pending_station_list
                     return dets, i
@@ -310,89 +509,77 @@ class FinderBaseDialect:
                 i = j
                 continue
 
-            m_eid = self.P_EVENT_ID.search(line)
+            m_eid = event_id_search(line) if "event_id" in line else None
             if not m_eid:
                 i += 1
                 continue
 
             event_id = m_eid.group(1)
 
-            get_mag = get_lat = get_lon = get_dep = get_lik = get_otm = None
+            got: Dict[str, str] = {}
             rupture_list: List[FaultVertex] = []
             emission_ts_iso: Optional[str] = None
 
             j = i + 1
             next_event_idx: Optional[int] = None
-            while j < len(lines):
+            while j < n_lines:
                 s = lines[j]
 
-                if self.P_STATION_HEADER.search(s):
+                if "threshold" in s and station_header(s):
                     break
 
-                if self.P_EVENT_ID.search(s):
+                if "event_id" in s and event_id_search(s):
                     next_event_idx = j
                     break
 
-                if not emission_ts_iso:
-                    mp = self.P_PREFIX_TS.search(s)
+                if not emission_ts_iso and (not year_first or s[:4].isdigit()):
+                    mp = prefix_ts(s)
                     if mp:
                         emission_ts_iso = to_iso_utc_z(mp.group(1))
 
-                if (m := self.P_GET_MAG.search(s)):
-                    get_mag = float(m.group(1))
-                if (m := self.P_GET_LAT.search(s)):
-                    get_lat = float(m.group(1))
-                if (m := self.P_GET_LON.search(s)):
-                    get_lon = float(m.group(1))
-                if (m := self.P_GET_DEP.search(s)):
-                    get_dep = float(m.group(1))
-                if (m := self.P_GET_LIK.search(s)):
-                    get_lik = float(m.group(1))
-                if (m := self.P_GET_OTM.search(s)):
-                    get_otm = m.group(1)
-
-                if (m := self.P_GET_RUP.search(s)):
-                    coords = self.P_RUP_PT.findall(m.group(1))
+                # Every get_* and rupture line is a key = value line.
+                if "=" not in s:
+                    j += 1
+                    continue
+
+                if "->" in s:
+                    for m in get_any(s):
+                        key = m.lastgroup
+                        got[key] = m.group(key)
+
+                if "get_rupture_list" in s and (m := get_rupture(s)):
+                    coords = rupture_points(m.group(1))
                     if coords:
-                        rupture_list.extend(
-                            [
-                                FaultVertex(
-                                    lat=float(a),
-                                    lon=float(b),
-                                    depth=float(c),
-                                )
-                                for a, b, c in coords
-                            ]
-                        )
                         k = j + 1
-                        while k < len(lines) and (
+                        while k < n_lines and (
                             next_event_idx is None or k < next_event_idx
                         ):
-                            mc = self.P_RUP_LINE.match(lines[k])
+                            mc = rupture_line(lines[k])
                             if not mc:
                                 break
-                            a, b, c = mc.groups()
-                            rupture_list.append(
-                                FaultVertex(
-                                    lat=float(a),
-                                    lon=float(b),
-                                    depth=float(c),
-                                )
-                            )
+                            coords.append(mc.groups())
                             k += 1
+                        rupture_list.extend(_fault_vertices(coords))
                         j = k
                         continue
                 j += 1
 
             block_end = next_event_idx if next_event_idx is not None else j
 
-            if not finalize and block_end >= len(lines):
+            get_mag = float(got["mag"]) if "mag" in got else None
+            get_lat = float(got["lat"]) if "lat" in got else None
+            get_lon = float(got["lon"]) if "lon" in got else None
+            get_dep = float(got["dep"]) if "dep" in got else None
+            get_lik = float(got["lik"]) if "lik" in got else None
+            get_otm = got.get("otm")
+
+            if not finalize and block_end >= n_lines:
                 state.pending_station_list = pending_station_list
                 return dets, i
 
             if get_otm is None:
                 core = DetectionCore(
-                    id=str(event_id),
+                    id=event_id,
                     mag=str(get_mag) if get_mag is not None else "0.0",
                     lat=str(get_lat) if get_lat is not None else "0.0",
                     lon=str(get_lon) if get_lon is not None else "0.0",
@@ -403,7 +590,7 @@ class FinderBaseDialect:
                 )
             else:
                 core = DetectionCore(
-                    id=str(event_id),
+                    id=event_id,
                     mag=str(get_mag) if get_mag is not None else "0.0",
                     lat=str(get_lat) if get_lat is not None else "0.0",
                     lon=str(get_lon) if get_lon is not None else "0.0",
@@ -423,23 +610,13 @@ class FinderBaseDialect:
 
             pga_list: List[GMObs] = []
             if pending_station_list:
-                for lat, lon, sncl, t_epoch, pga in pending_station_list:
-                    pga_list.append(
-                        GMObs(
-                            orig_sys="finder",
-                            SNCL=str(sncl),
-                            value=float(pga),
-                            lat=float(lat),
-                            lon=float(lon),
-                            time=epoch_to_iso_z(str(t_epoch)),
-                        )
-                    )
+                pga_list.extend(_station_obs(pending_station_list))
                 pending_station_list = None
 
             dets.append(
                 Detection(
                     timestamp=timestamp_iso,
-                    event_id=str(event_id),
+                    event_id=event_id,
                     category="live",
                     instance="finder@unknown",
                     orig_sys="finder",
@@ -454,7 +631,7 @@ class FinderBaseDialect:
 
         state.pending_station_list = pending_station_list
         state.version_by_event = version_by_event
-        return dets, len(lines)
+        return dets, n_lines
 
     def parse_stream(
         self,
@@ -469,39 +646,44 @@ class FinderBaseDialect:
         """
         state = state or FinderStreamState()
 
-        incoming = list(new_lines)
+        # new_lines is only read, never copied; a pending partial line is
+        # glued onto the first new line.
+        incoming = new_lines
         if state.partial_line:
             if incoming:
-                incoming[0] = state.partial_line + incoming[0]
+                incoming = [state.partial_line + incoming[0]]
+                incoming.extend(islice(new_lines, 1, None))
             else:
                 incoming = [state.partial_line]
             state.partial_line = ""
 
-        # Separate complete lines from a trailing partial (when not finalizing).
-        lines_for_buffer = list(incoming)
-        if not finalize and lines_for_buffer and not lines_for_buffer[-1].endswith("\n"):
-            state.partial_line = lines_for_buffer.pop()
-
-        # Track recent complete lines before parsing.
-        for line in lines_for_buffer:
-            state.absolute_line_counter += 1
-            state.recent_lines.append((state.absolute_line_counter, line))
-
-        state.buffer.extend(lines_for_buffer)
-
-        if finalize and state.partial_line:
-            line = state.partial_line
-            state.buffer.append(line)
-            state.partial_line = ""
-            state.absolute_line_counter += 1
-            state.recent_lines.append((state.absolute_line_counter, line))
+        # Buffer complete lines; hold back a trailing partial (when not
+        # finalizing) until the rest of it arrives.
+        n_complete = len(incoming)
+        state.buffer.extend(incoming)
+        if not finalize and incoming and not incoming[-1].endswith("\n"):
+            state.partial_line = state.buffer.pop()
+            n_complete -= 1
+
+        # Track recent complete lines before parsing. Only the tail that fits
+        # in the window is turned into (line_no, text) tuples.
+        skip = max(0, n_complete - (state.recent_lines.maxlen or n_complete))
+        first = state.absolute_line_counter + 1
+        state.recent_lines.extend(
+            zip(range(first + skip, first + n_complete), islice(incoming, skip, n_complete))
+        )
+        state.absolute_line_counter += n_complete
 
         dets, consumed_idx = self._parse_detections_stream(
             state.buffer, state, finalize=finalize
         )
-        ann = self._parse_annotations_stream(state.buffer[:consumed_idx], state)
+        buffer = state.buffer
+        # Whole-buffer consumption (the usual case, and every parse_file
+        # call) needs no prefix copy.
+        consumed = buffer if consumed_idx == len(buffer) else buffer[:consumed_idx]
+        ann = self._parse_annotations_stream(consumed, state)
 
-        state.buffer = state.buffer[consumed_idx:]
+        del state.buffer[:consumed_idx]
         state.line_offset += consumed_idx
 
         return dets, ann, state
@@ -561,11 +743,12 @@ class ShakeAlertFinderDialect(FinderBaseDialect):
         state: FinderStreamState,
     ) -> List[Annotation]:
         ann: List[Annotation] = []
-        patterns_cfg = self.profile.get("patterns", {})
+        matching_patterns = self._matching_patterns
+        inline_abs_ts = self.P_INLINE_ABS_TS.search
 
         for idx, line in enumerate(lines):
             absolute_line = state.line_offset + idx + 1
-            m_inline = self.P_INLINE_ABS_TS.search(line)
+            m_inline = inline_abs_ts(line)
             if not m_inline:
                 continue
 
@@ -577,19 +760,16 @@ class ShakeAlertFinderDialect(FinderBaseDialect):
                 state.file_start_ts_iso = ts_iso
             state.file_end_ts_iso = ts_iso
 
-            for pid, pat in patterns_cfg.items():
-                if pid == "timestamp_regex":
-                    continue
-                if re.search(pat, line):
-                    ann.append(
-                        Annotation(
-                            timestamp=ts_iso,
-                            pattern=pat,
-                            line=absolute_line,
-                            text=line.rstrip("\n"),
-                            pattern_id=pid,
-                        )
+            for pid, pat in matching_patterns(line):
+                ann.append(
+                    Annotation(
+                        timestamp=ts_iso,
+                        pattern=pat,
+                        line=absolute_line,
+                        text=line.rstrip("\n"),
+                        pattern_id=pid,
                     )
+                )
 
         return ann
 
@@ -621,8 +801,13 @@ class ShakeAlertFinderDialect(FinderBaseDialect):
 
         while i < len(lines):
             line = lines[i]
-            payload = line.split("|", 2)[-1].lstrip() if "|" in line else line
+            # Most lines carry no XML at all; skip them before extracting
+            # the payload.
+            if "<event_message" not in line:
+                i += 1
+                continue
 
+            payload = line.split("|", 2)[-1].lstrip() if "|" in line else line
             if "<event_message" not in payload:
                 i += 1
                 continue
@@ -640,19 +825,18 @@ class ShakeAlertFinderDialect(FinderBaseDialect):
             if not finalize and (j >= len(lines) or "</event_message>" not in xml_lines[-1]):
                 return dets, i
 
-            xml_str = "".join(l.rstrip("\n") for l in xml_lines)
-
             try:
-                root = ET.fromstring(xml_str)
+                root = _xml_from_pieces(l.rstrip("\n") for l in xml_lines)
             except Exception:
                 i = j + 1
                 continue
 
-            timestamp_attr = root.attrib.get("timestamp")
-            category = root.attrib.get("category") or "live"
-            instance = root.attrib.get("instance") or "finder@unknown"
-            orig_sys = root.attrib.get("orig_sys") or "finder"
-            version_attr = root.attrib.get("version") or "0"
+            attrib = root.attrib
+            timestamp_attr = attrib.get("timestamp")
+            category = attrib.get("category") or "live"
+            instance = attrib.get("instance") or "finder@unknown"
+            orig_sys = attrib.get("orig_sys") or "finder"
+            version_attr = attrib.get("version") or "0"
 
             core_el = root.find("core_info")
             event_id = core_el.attrib.get("id") if core_el is not None else "0"
@@ -693,23 +877,28 @@ class ShakeAlertFinderDialect(FinderBaseDialect):
                 likelihood=likelihood,
             )
 
+            # Numeric texts go through float() (malformed entries are
+            # skipped) and into str fields as validation would render them,
+            # so the models are built with construct().
             fault_vertices: List[FaultVertex] = []
+            make_vertex = FaultVertex.construct
             for v in root.findall("fault_info/finite_fault/segment/vertices/vertex"):
                 v_lat = v.findtext("lat")
                 v_lon = v.findtext("lon")
                 v_dep = v.findtext("depth")
                 try:
                     fault_vertices.append(
-                        FaultVertex(
-                            lat=float(v_lat) if v_lat is not None else 0.0,
-                            lon=float(v_lon) if v_lon is not None else 0.0,
-                            depth=float(v_dep) if v_dep is not None else 0.0,
+                        make_vertex(
+                            lat=str(float(v_lat)) if v_lat is not None else "0.0",
+                            lon=str(float(v_lon)) if v_lon is not None else "0.0",
+                            depth=str(float(v_dep)) if v_dep is not None else "0.0",
                         )
                     )
                 except ValueError:
                     continue
 
             pga_list: List[GMObs] = []
+            make_obs = GMObs.construct
             pga_root = root.find("gm_info/gmpoint_obs/pga_obs")
             if pga_root is not None:
                 for obs in pga_root.findall("obs"):
@@ -719,13 +908,13 @@ class ShakeAlertFinderDialect(FinderBaseDialect):
                     lon_txt = obs.findtext("lon") or "0"
                     time_txt = (obs.findtext("time") or "").strip()
                     try:
-                        value = float(value_txt)
-                        lat_obs = float(lat_txt)
-                        lon_obs = float(lon_txt)
+                        value = str(float(value_txt))
+                        lat_obs = str(float(lat_txt))
+                        lon_obs = str(float(lon_txt))
                     except ValueError:
                         continue
                     pga_list.append(
-                        GMObs(
+                        make_obs(
                             orig_sys="finder",
                             SNCL=sncl,
                             value=value,
@@ -772,6 +961,26 @@ class NativeFinderDialect(FinderBaseDialect):
 
     PROFILE_NAME: str = "profiles/finder_time_vs_mag.json"  
 
+    def _attach_stations_to_detection(
+        self,
+        dets: List[Detection],
+        idx: Optional[int],
+        stations: List[tuple],
+    ) -> bool:
+        """
+        Append a station block's PGA observations to dets[idx]. Returns False
+        (and changes nothing) when there is no such detection in this batch.
+        """
+        if idx is None or idx < 0 or idx >= len(dets):
+            return False
+        det = dets[idx]
+        gm_info = det.gm_info or {"pgv_obs": [], "pga_obs": []}
+        pga_list = gm_info.setdefault("pga_obs", [])
+        pga_list.extend(_station_obs(stations))
+        gm_info.setdefault("pgv_obs", [])
+        det.gm_info = gm_info
+        return True
+
     def _parse_detections_stream(
         self,
         lines: List[str],
@@ -779,70 +988,56 @@ class NativeFinderDialect(FinderBaseDialect):
         finalize: bool = False,
     ) -> Tuple[List[Detection], int]:
         dets: List[Detection] = []
+        # Hoisted out of the per-line loop.
+        n_lines = len(lines)
+        station_header = self.P_STATION_HEADER.search
+        station_rows = self.P_STATION_ROW.findall
+        event_id_search = self.P_EVENT_ID.search
+        prefix_ts = self.P_PREFIX_TS.match
+        year_first = self.PREFIX_TS_YEAR_FIRST
+        get_any = self.P_GET_ANY.finditer
+        get_rupture = self.P_GET_RUP.search
+        rupture_points = self.P_RUP_PT.findall
+        rupture_line = self.P_RUP_LINE.match
+
         i = 0
         pending_station_list = state.pending_station_list
         version_by_event = state.version_by_event
-        last_detection_index = state.last_detection_index
+        # The index points into this call's dets only; detections from an
+        # earlier call have already been handed out.
+        last_detection_index = None
         last_detection_event_id = state.last_detection_event_id
 
-        def attach_to_last(stations: List[tuple]) -> bool:
-            nonlocal dets, last_detection_index
-            if last_detection_index is None:
-                return False
-            if last_detection_index < 0 or last_detection_index >= len(dets):
-                return False
-            det = dets[last_detection_index]
-            gm_info = det.gm_info or {"pgv_obs": [], "pga_obs": []}
-            pga_list = gm_info.setdefault("pga_obs", [])
-            for lat, lon, sncl, t_epoch, pga in stations:
-                pga_list.append(
-                    GMObs(
-                        orig_sys="finder",
-                        SNCL=str(sncl),
-                        value=str(pga),
-                        lat=str(lat),
-                        lon=str(lon),
-                        time=epoch_to_iso_z(str(t_epoch)),
-                    )
-                )
-            gm_info.setdefault("pgv_obs", [])
-            det.gm_info = gm_info
-            return True
-
-        while i < len(lines):
+        while i < n_lines:
             line = lines[i]
 
-            if self.P_STATION_HEADER.search(line):
+            if "threshold" in line and station_header(line):
                 j = i + 1
                 stations = []
-                while j < len(lines):
-                    mrow = self.P_STATION_ROW.findall(lines[j])
+                while j < n_lines:
+                    mrow = station_rows(lines[j])
                     if not mrow:
                         break
-                    for match in mrow:
-                        sta, lat, lon, pga, t_epoch, include = (
-                            match[0],
-                            match[1],
-                            match[2],
-                            match[3],
-                            match[4],
-                            match[5],
-                        )
-                        if int(include) == 1:
-                            stations.append(
-                                (
-                                    float(lat),
-                                    float(lon),
-                                    trim(sta),
-                                    float(t_epoch),
-                                    float(pga),
-                                )
-                            )
+                    # include is a single digit; only included rows pay
+                    # for the float conversions.
+                    stations.extend(
+                        (float(lat), float(lon), sta.strip(), float(t_epoch), float(pga))
+                        for sta, lat, lon, pga, t_epoch, include in mrow
+                        if include == "1"
+                    )
                     j += 1
 
+                if not finalize and j >= n_lines:
+                    # The block may continue in the next chunk; re-read it
+                    # whole so attachment does not depend on chunking.
+                    state.pending_station_list = pending_station_list
+                    state.last_detection_index = last_detection_index
+                    state.last_detection_event_id = last_detection_event_id
+                    return dets, i
+
                 block_event_id = None
-                for k in range(i, min(j, len(lines))):
-                    m_block = self.P_EVENT_ID.search(lines[k])
+                for k in range(i, min(j, n_lines)):
+                    m_block = event_id_search(lines[k])
                     if m_block:
                         block_event_id = m_block.group(1)
                         break
@@ -851,7 +1046,7 @@ class NativeFinderDialect(FinderBaseDialect):
                 if last_detection_index is not None and (
                     block_event_id is None or block_event_id == last_detection_event_id
                 ):
-                    attached = attach_to_last(stations)
+                    attached = self._attach_stations_to_detection(dets, last_detection_index, stations)
 
                 if attached:
                     pending_station_list = None
@@ -861,83 +1056,82 @@ class NativeFinderDialect(FinderBaseDialect):
                 i = j
                 continue
 
-            m_eid = self.P_EVENT_ID.search(line)
+            m_eid = event_id_search(line) if "event_id" in line else None
             if not m_eid:
                 i += 1
                 continue
 
             event_id = m_eid.group(1)
 
-            get_mag = get_lat = get_lon = get_dep = get_lik = get_otm = None
+            got: Dict[str, str] = {}
             rupture_list: List[FaultVertex] = []
             emission_ts_iso: Optional[str] = None
 
             j = i + 1
             next_event_idx: Optional[int] = None
-            while j < len(lines):
+            station_idx: Optional[int] = None
+            while j < n_lines:
                 s = lines[j]
 
-                if self.P_STATION_HEADER.search(s):
+                if "threshold" in s and station_header(s):
+                    station_idx = j
                     break
 
-                if self.P_EVENT_ID.search(s):
+                if "event_id" in s and event_id_search(s):
                     next_event_idx = j
                     break
 
-                if not emission_ts_iso:
-                    mp = self.P_PREFIX_TS.search(s)
+                if not emission_ts_iso and (not year_first or s[:4].isdigit()):
+                    mp = prefix_ts(s)
                     if mp:
                         emission_ts_iso = to_iso_utc_z(mp.group(1))
 
-                if (m := self.P_GET_MAG.search(s)):
-                    get_mag = float(m.group(1))
-                if (m := self.P_GET_LAT.search(s)):
-                    get_lat = float(m.group(1))
-                if (m := self.P_GET_LON.search(s)):
-                    get_lon = float(m.group(1))
-                if (m := self.P_GET_DEP.search(s)):
-                    get_dep = float(m.group(1))
-                if (m := self.P_GET_LIK.search(s)):
-                    get_lik = float(m.group(1))
-                if (m := self.P_GET_OTM.search(s)):
-                    get_otm = m.group(1)
-
-                if (m := self.P_GET_RUP.search(s)):
-                    coords = self.P_RUP_PT.findall(m.group(1))
+                # Every get_* and rupture line is a key = value line.
+                if "=" not in s:
+                    j += 1
+                    continue
+
+                if "->" in s:
+                    for m in get_any(s):
+                        key = m.lastgroup
+                        got[key] = m.group(key)
+
+                if "get_rupture_list" in s and (m := get_rupture(s)):
+                    coords = rupture_points(m.group(1))
                     if coords:
-                        rupture_list.extend(
-                            [
-                                FaultVertex(
-                                    lat=float(a),
-                                    lon=float(b),
-                                    depth=float(c),
-                                )
-                                for a, b, c in coords
-                            ]
-                        )
                         k = j + 1
-                        while k < len(lines) and (
+                        while k < n_lines and (
                             next_event_idx is None or k < next_event_idx
                         ):
-                            mc = self.P_RUP_LINE.match(lines[k])
+                            mc = rupture_line(lines[k])
                             if not mc:
                                 break
-                            a, b, c = mc.groups()
-                            rupture_list.append(
-                                FaultVertex(
-                                    lat=float(a),
-                                    lon=float(b),
-                                    depth=float(c),
-                                )
-                            )
+                            coords.append(mc.groups())
                             k += 1
+                        rupture_list.extend(_fault_vertices(coords))
                         j = k
                         continue
                 j += 1
 
             block_end = next_event_idx if next_event_idx is not None else j
 
-            if not finalize and block_end >= len(lines):
+            get_mag = float(got["mag"]) if "mag" in got else None
+            get_lat = float(got["lat"]) if "lat" in got else None
+            get_lon = float(got["lon"]) if "lon" in got else None
+            get_dep = float(got["dep"]) if "dep" in got else None
+            get_lik = float(got["lik"]) if "lik" in got else None
+            get_otm = got.get("otm")
+
+            if not finalize and station_idx is not None:
+                # A station block right after the detection attaches to it;
+                # emit both from the same call once the block is complete.
+                k = station_idx + 1
+                while k < n_lines and station_rows(lines[k]):
+                    k += 1
+                if k >= n_lines:
+                    block_end = n_lines
+
+            if not finalize and block_end >= n_lines:
                 state.pending_station_list = pending_station_list
                 state.last_detection_index = last_detection_index
                 state.last_detection_event_id = last_detection_event_id
@@ -945,7 +1139,7 @@ class NativeFinderDialect(FinderBaseDialect):
 
             if get_otm is None:
                 core = DetectionCore(
-                    id=str(event_id),
+                    id=event_id,
                     mag=str(get_mag) if get_mag is not None else "0.0",
                     lat=str(get_lat) if get_lat is not None else "0.0",
                     lon=str(get_lon) if get_lon is not None else "0.0",
@@ -956,7 +1150,7 @@ class NativeFinderDialect(FinderBaseDialect):
                 )
             else:
                 core = DetectionCore(
-                    id=str(event_id),
+                    id=event_id,
                     mag=str(get_mag) if get_mag is not None else "0.0",
                     lat=str(get_lat) if get_lat is not None else "0.0",
                     lon=str(get_lon) if get_lon is not None else "0.0",
@@ -977,7 +1171,7 @@ class NativeFinderDialect(FinderBaseDialect):
             dets.append(
                 Detection(
                     timestamp=timestamp_iso,
-                    event_id=str(event_id),
+                    event_id=event_id,
                     category="live",
                     instance="finder@unknown",
                     orig_sys="finder",
@@ -989,10 +1183,10 @@ class NativeFinderDialect(FinderBaseDialect):
             )
 
             last_detection_index = len(dets) - 1
-            last_detection_event_id = str(event_id)
+            last_detection_event_id = event_id
 
             if pending_station_list:
-                if not attach_to_last(pending_station_list):
+                if not self._attach_stations_to_detection(dets, last_detection_index, pending_station_list):
                     # Keep for the next detection in case of mismatch.
                     pass
                 else:
@@ -1002,19 +1196,20 @@ class NativeFinderDialect(FinderBaseDialect):
 
         if finalize and pending_station_list and last_detection_index is not None:
             if last_detection_index < len(dets):
-                attach_to_last(pending_station_list)
+                self._attach_stations_to_detection(dets, last_detection_index, pending_station_list)
                 pending_station_list = None
 
         state.pending_station_list = pending_station_list
         state.version_by_event = version_by_event
         state.last_detection_index = last_detection_index
         state.last_detection_event_id = last_detection_event_id
-        return dets, len(lines)
+        return dets, n_lines
 
 
 class NativeFinderLegacyDialect(FinderBaseDialect):
     # P_PREFIX_TS might be None or a no-op; annotations get no ts or use origin time.
     P_PREFIX_TS = re.compile(r"^$")
+    PREFIX_TS_YEAR_FIRST = False
     START_PLAYBACK_RE = None
 
     # Legacy native logs usually carry only epoch-style timestamps inside the block,
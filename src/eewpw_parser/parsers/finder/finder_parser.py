@@ -19,6 +19,8 @@ class FinderParser:
         self.cfg = cfg
         self.dialect = cfg.get("dialect", "scfinder")
         self.verbose = bool(cfg.get("verbose", False))
+        # Worker processes for multi-file runs; 1 parses in-process.
+        self.workers = int(cfg.get("workers") or 1)
 
     def _get_worker(self):
         if hasattr(self, "_worker"):
@@ -75,8 +77,7 @@ class FinderParser:
             print("==== Finder Parse ====")
             print(f"Dialect: {self.dialect} Files: {len(files)}")
 
-        for p in files:
-            d, a, extras = worker.parse_file(p)
+        for p, (d, a, extras) in zip(files, worker.parse_files(files, max_workers=self.workers)):
             dets_all.extend(d)
             ann_all.extend(a)
             per_file_extras.append(extras)
@@ -1,14 +1,56 @@
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-class Annotation(BaseModel):
+from .utils import json_dumps_bytes
+
+class _Schema(BaseModel):
+    class Config:
+        # Store already-validated model instances as-is when they are nested in
+        # another model (Detection -> GMObs, FinalDoc -> Detection) instead of
+        # shallow-copying each one.
+        copy_on_model_validation = "none"
+
+# Private per-instance serialization caches, see _CachedSerialization.
+_CACHE_ATTRS = ("_dedup_key", "_payload_json")
+
+class _CachedSerialization(_Schema):
+    # Memoized dedup digest (see dedup.dedup_key) and compact payload JSON
+    # (see payload_json); dropped on any field assignment or copy() so they
+    # never outlive the values they were built from.
+    _dedup_key: Optional[bytes] = PrivateAttr(default=None)
+    _payload_json: Optional[bytes] = PrivateAttr(default=None)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name not in _CACHE_ATTRS:
+            for attr in _CACHE_ATTRS:
+                object.__setattr__(self, attr, None)
+
+    def copy(self, **kwargs):
+        m = super().copy(**kwargs)
+        for attr in _CACHE_ATTRS:
+            object.__setattr__(m, attr, None)
+        return m
+
+    def payload_json(self) -> bytes:
+        """
+        Compact JSON bytes of .dict(), built once and shared by every writer
+        or sink that emits this record.
+        """
+        data = self._payload_json
+        if data is None:
+            data = json_dumps_bytes(self.dict())
+            object.__setattr__(self, "_payload_json", data)
+        return data
+
+class Annotation(_CachedSerialization):
     timestamp: str  # ISO-8601 Z
     pattern: str
     line: str  # int
     text: str
     pattern_id: Optional[str] = None
 
-class GMObs(BaseModel):
+class GMObs(_Schema):
     orig_sys: str
     SNCL: str
     value: str  # float
@@ -16,7 +58,7 @@ class GMObs(BaseModel):
     lon: str  # float
     time: str  # ISO-8601 Z
 
-class DetectionCore(BaseModel):
+class DetectionCore(_Schema):
     id: str
     mag: str # float
     lat: str # float
@@ -26,13 +68,13 @@ class DetectionCore(BaseModel):
     likelihood: Optional[str] = None
     vs_median_single_station_mag: Optional[str] = None
 
-class FaultVertex(BaseModel):
+class FaultVertex(_Schema):
     # float values, but we keep as str to preserve formatting
     lat: str 
     lon: str
     depth: str
 
-class Detection(BaseModel):
+class Detection(_CachedSerialization):
     timestamp: str           # ISO-8601 Z (emission time for this detection)
     event_id: str            # IDs must be strings
     category: str
@@ -43,7 +85,7 @@ class Detection(BaseModel):
     fault_info: List[FaultVertex] = Field(default_factory=list)
     gm_info: Dict[str, List[GMObs]] = Field(default_factory=lambda: {"pgv_obs": [], "pga_obs": []})
 
-class Meta(BaseModel):
+class Meta(_Schema):
     algo: str
     dialect: str
     files: Optional[List[str]] = None
@@ -53,7 +95,7 @@ class Meta(BaseModel):
     extras: Dict[str, Any] = Field(default_factory=dict)
     stats_total: Dict[str, int] = Field(default_factory=dict)
 
-class FinalDoc(BaseModel):
+class FinalDoc(_Schema):
     meta: Meta
     annotations: Dict[str, List[Annotation]]
     detections: List[Detection]
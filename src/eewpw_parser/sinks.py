@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 from typing import Protocol, Optional, Dict, List
 from pathlib import Path
-import json
 
 from .schemas import Meta, Detection, Annotation, FinalDoc
 from .dedup import deduplicate_detections
+from .utils import json_dumps_bytes, json_record_line
 
 
 class BaseSink(Protocol):
@@ -52,19 +52,17 @@ class JsonlStreamSink(BaseSink):
         self._dialect = dialect
         self._instance = instance
         self.verbose = verbose
-        self._fh = path.open("w", encoding="utf-8")
+        self._fh = path.open("wb")
 
     def start_run(self) -> None:
         # No-op; file is opened on init.
         return None
 
-    def _write_line(self, obj: dict) -> None:
-        self._fh.write(json.dumps(obj, ensure_ascii=False, separators=(",", ":")) + "\n")
+    def _write_line(self, obj: dict, payload_json: bytes, ts: Optional[str]) -> None:
+        self._fh.write(json_record_line(obj, payload_json))
         self._fh.flush()
         if self.verbose:
-            payload = obj.get("payload") or {}
-            ts = payload.get("timestamp") or payload.get("orig_time") or payload.get("started_at") or "-"
-            print(f"[stream] {obj.get('record_type')} @ {ts}", flush=True)
+            print(f"[stream] {obj.get('record_type')} @ {ts or '-'}", flush=True)
 
     def emit_detection(self, det: Detection) -> None:
         rec = {
@@ -72,9 +70,8 @@ class JsonlStreamSink(BaseSink):
             "algo": self._algo,
             "dialect": self._dialect,
             "instance": self._instance,
-            "payload": det.dict(),
         }
-        self._write_line(rec)
+        self._write_line(rec, det.payload_json(), det.timestamp)
 
     def emit_annotation(self, profile: str, ann: Annotation) -> None:
         rec = {
@@ -83,9 +80,8 @@ class JsonlStreamSink(BaseSink):
             "dialect": self._dialect,
             "instance": self._instance,
             "profile": profile,
-            "payload": ann.dict(),
         }
-        self._write_line(rec)
+        self._write_line(rec, ann.payload_json(), ann.timestamp)
 
     def finalize(self, meta: Meta) -> Optional[FinalDoc]:
         rec = {
@@ -93,9 +89,8 @@ class JsonlStreamSink(BaseSink):
             "algo": self._algo,
             "dialect": self._dialect,
             "instance": self._instance,
-            "payload": meta.dict(),
         }
-        self._write_line(rec)
+        self._write_line(rec, json_dumps_bytes(meta.dict()), meta.started_at)
         self._fh.close()
         return None
 
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 import os
 import time
+from itertools import islice
 from typing import Iterable, List, Tuple
 
 
@@ -13,6 +14,14 @@ class LineSource:
     def __iter__(self) -> Iterable[str]:
         raise NotImplementedError()
 
+    def iter_batches(self, batch_lines: int) -> Iterable[List[str]]:
+        """
+        Yield lists of up to batch_lines lines. The default yields one line per
+        list, so a blocking source never holds back lines it already produced.
+        """
+        for line in self:
+            yield [line]
+
 
 class ReplayLineSource(LineSource):
     def __init__(self, files: List[str], encoding: str = "utf-8", errors: str = "ignore"):
@@ -33,6 +42,14 @@ class ReplayLineSource(LineSource):
             for line in lines:
                 yield line
 
+    def iter_batches(self, batch_lines: int) -> Iterable[List[str]]:
+        for _, lines in self.iterate_files():
+            while True:
+                batch = list(islice(lines, batch_lines))
+                if not batch:
+                    break
+                yield batch
+
 
 class TailLineSource(LineSource):
     def __init__(
@@ -50,21 +67,38 @@ class TailLineSource(LineSource):
         self.follow = follow
 
     def __iter__(self) -> Iterable[str]:
+        for batch in self.iter_batches(1):
+            yield from batch
+
+    def iter_batches(self, batch_lines: int) -> Iterable[List[str]]:
+        """
+        Yield up to batch_lines lines at a time. A partial batch is yielded as
+        soon as the file has no more data, so batching never delays a line.
+        """
         with open(self.path, "r", encoding="utf-8", errors="ignore") as f:
             if self.seek_end:
                 f.seek(0, os.SEEK_END)
 
             lines_yielded = 0
+            batch: List[str] = []
             while True:
                 line = f.readline()
                 if not line:
+                    if batch:
+                        yield batch
+                        batch = []
                     if not self.follow:
                         break
                     time.sleep(self.poll_interval)
                     continue
 
-                yield line
+                batch.append(line)
                 lines_yielded += 1
 
                 if self.max_lines is not None and lines_yielded >= self.max_lines:
                     break
+                if len(batch) >= batch_lines:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
@@ -1,8 +1,47 @@
+import json
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Optional, Union
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover - older Pythons
+    import sre_parse as _sre_parse
 from dateutil import parser as dtp
 from dateutil.parser import ParserError
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+# 'YYYY-MM-DD HH:MM:SS[.ffffff][Z]' (or '/' date separators, or 'T'), the
+# shapes every dialect emits; parsed without going through dateutil.
+_P_PLAIN_TS = re.compile(
+    r"(\d{4})([/-])(\d{2})\2(\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?Z?"
+)
+
+def _parse_plain_timestamp(s: str) -> Optional[datetime]:
+    """
+    Fast path for to_iso_utc_z: the datetime dateutil would return for the
+    plain shapes matched by _P_PLAIN_TS, or None to fall back to dateutil.
+    """
+    m = _P_PLAIN_TS.fullmatch(s)
+    if m is None:
+        return None
+    year, _, month, day, hour, minute, second, frac = m.groups()
+    try:
+        return datetime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second),
+            int(frac.ljust(6, "0")) if frac else 0,
+            tzinfo=timezone.utc if s.endswith("Z") else None,
+        )
+    except ValueError:
+        return None
+
+# Log timestamps repeat heavily (one per second across many lines), so the
+# normalised forms are memoised.
+@lru_cache(maxsize=8192)
 def to_iso_utc_z(s: str) -> str:
     """
     Flexible timestamp normalization to ISO-8601 UTC Z.
@@ -20,10 +59,12 @@ def to_iso_utc_z(s: str) -> str:
         base, frac = m.groups()
         s = f"{base}.{frac}"
 
-    try:
-        dt = dtp.parse(s)
-    except ParserError as exc:
-        raise ParserError(f"Unsupported timestamp format for to_iso_utc_z: {s}") from exc
+    dt = _parse_plain_timestamp(s)
+    if dt is None:
+        try:
+            dt = dtp.parse(s)
+        except ParserError as exc:
+            raise ParserError(f"Unsupported timestamp format for to_iso_utc_z: {s}") from exc
 
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
@@ -35,10 +76,63 @@ def to_iso_utc_z(s: str) -> str:
         return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
     return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def epoch_to_iso_z(epoch_str: str) -> str:
+@lru_cache(maxsize=8192)
+def epoch_to_iso_z(epoch_str: Union[str, float]) -> str:
     # epoch may come as float string
     dt = datetime.fromtimestamp(float(epoch_str), tz=timezone.utc)
     return dt.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
 
 def trim(s: str) -> str:
-    return s.strip()
\ No newline at end of file
+    return s.strip()
+
+def required_literal(pattern: str) -> Optional[str]:
+    """
+    Longest literal substring that every match of pattern must contain, or
+    None when there is none (alternation at top level, case-insensitive
+    flags, or an unparsable pattern). Used as a cheap `in` prefilter before
+    running the regex on a line.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+    if parsed.state.flags & re.IGNORECASE:
+        return None
+    best: str = ""
+    run: list = []
+    for op, av in list(parsed) + [(None, None)]:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    return best or None
+
+def json_dumps_bytes(obj: Any, sort_keys: bool = False, indent: Optional[int] = None) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes (non-ASCII kept as-is).
+    Uses orjson when installed and the requested layout is supported
+    (compact or indent=2); otherwise falls back to the stdlib encoder.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(
+        obj,
+        sort_keys=sort_keys,
+        indent=indent,
+        ensure_ascii=False,
+        separators=(",", ":") if indent is None else None,
+    ).encode("utf-8")
+
+def json_record_line(header: dict, payload_json: bytes) -> bytes:
+    """
+    Build one compact JSONL record (UTF-8 bytes ending in a newline) from a
+    header dict plus an already encoded payload, appended as its last key.
+    """
+    return json_dumps_bytes(header)[:-1] + b',"payload":' + payload_json + b"}\n"
@@ -31,6 +31,49 @@ class TestCleanupLiveRaw(unittest.TestCase):
             expected_keep = {dates[0].strftime("%Y-%m-%d"), dates[1].strftime("%Y-%m-%d")}
             self.assertEqual(remaining, expected_keep)
 
+    def test_large_sweep_keeps_recent_and_foreign_files(self):
+        with tempfile.TemporaryDirectory() as td:
+            data_root = Path(td)
+            algo_dir = data_root / "live" / "raw" / "finder"
+            algo_dir.mkdir(parents=True, exist_ok=True)
+
+            today = date.today()
+            for offset in range(-1, 60):
+                d = today - timedelta(days=offset)
+                (algo_dir / f"{d.strftime('%Y-%m-%d')}_finder.jsonl").write_text("{}", encoding="utf-8")
+            (algo_dir / "notes.jsonl").write_text("{}", encoding="utf-8")
+
+            cmd = [sys.executable, str(SCRIPT), "--data-root", str(data_root), "--retention-days", "2"]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+            remaining = sorted(p.name for p in algo_dir.glob("*.jsonl"))
+            expected = sorted(
+                [f"{(today - timedelta(days=o)).strftime('%Y-%m-%d')}_finder.jsonl" for o in (-1, 0, 1)]
+                + ["notes.jsonl"]
+            )
+            self.assertEqual(remaining, expected)
+
+    def test_symlinked_algo_dir_is_swept(self):
+        with tempfile.TemporaryDirectory() as td:
+            data_root = Path(td) / "data"
+            raw = data_root / "live" / "raw"
+            raw.mkdir(parents=True)
+            moved = Path(td) / "other_disk" / "finder"
+            moved.mkdir(parents=True)
+            (raw / "finder").symlink_to(moved, target_is_directory=True)
+
+            today = date.today()
+            (moved / "2001-01-01_finder.jsonl").write_text("{}", encoding="utf-8")
+            (moved / f"{today.strftime('%Y-%m-%d')}_finder.jsonl").write_text("{}", encoding="utf-8")
+
+            cmd = [sys.executable, str(SCRIPT), "--data-root", str(data_root), "--retention-days", "2"]
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, msg=result.stderr)
+
+            remaining = sorted(p.name for p in moved.glob("*.jsonl"))
+            self.assertEqual(remaining, [f"{today.strftime('%Y-%m-%d')}_finder.jsonl"])
+
 
 if __name__ == "__main__":
     unittest.main()
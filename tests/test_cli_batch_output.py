@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+CLI = [sys.executable, str(ROOT / "src" / "eewpw_parser" / "cli.py")]
+ENV = os.environ.copy()
+ENV["PYTHONPATH"] = str(ROOT / "src")
+
+SYNTH_LOG_CONTENT = """\
+2020/01/01 00:00:00 [notice/Application] event_id = 1
+2020/01/01 00:00:01 [notice/Application] -> get_mag = 3.2
+2020/01/01 00:00:02 [notice/Application] -> get_epicenter_lat = 1.0
+2020/01/01 00:00:03 [notice/Application] -> get_epicenter_lon = 2.0
+2020/01/01 00:00:04 [notice/Application] -> get_depth = 5.0
+2020/01/01 00:00:05 [notice/Application] -> get_origin_time = 1609459205
+"""
+
+
+class TestCLIBatchOutput(unittest.TestCase):
+    def _run(self, td: Path, pretty: bool) -> dict:
+        cfg_root = td / "cfg"
+        (cfg_root / "profiles").mkdir(parents=True)
+        (cfg_root / "global.json").write_text(
+            json.dumps({"output": {"pretty": pretty, "indent": 2, "ensure_ascii": False}}),
+            encoding="utf-8",
+        )
+        (cfg_root / "finder.json").write_text(json.dumps({"dialect": "scfinder"}), encoding="utf-8")
+        log_path = td / "finder.log"
+        log_path.write_text(SYNTH_LOG_CONTENT, encoding="utf-8")
+        out_path = td / ("pretty.json" if pretty else "compact.json")
+
+        cmd = CLI + ["--algo", "finder", "--config-root", str(cfg_root), "-o", str(out_path), str(log_path)]
+        result = subprocess.run(cmd, capture_output=True, text=True, env=ENV, cwd=td)
+        self.assertEqual(result.returncode, 0, msg=result.stderr)
+        return json.loads(out_path.read_text(encoding="utf-8"))
+
+    def test_compact_output_matches_pretty_output(self):
+        with tempfile.TemporaryDirectory() as td:
+            compact = self._run(Path(td), pretty=False)
+        with tempfile.TemporaryDirectory() as td:
+            pretty = self._run(Path(td), pretty=True)
+
+        self.assertEqual(list(compact), ["meta", "annotations", "detections"])
+        self.assertEqual(len(compact["detections"]), 1)
+        compact["meta"].pop("extras")
+        pretty["meta"].pop("extras")
+        self.assertEqual(compact, pretty)
+
+
+if __name__ == "__main__":
+    unittest.main()
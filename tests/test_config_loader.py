@@ -1,3 +1,4 @@
+import argparse
 import json
 import os
 import sys
@@ -11,6 +12,7 @@ ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT / "src"))
 
 from eewpw_parser import config_loader
+from eewpw_parser.config import apply_cli_overrides, get_data_root, load_config, load_profile
 
 
 class TestConfigLoader(unittest.TestCase):
@@ -55,6 +57,62 @@ class TestConfigLoader(unittest.TestCase):
                     cfg = config_loader.open_config_json("global.json")
                     self.assertEqual(cfg["output"]["indent"], 4)
 
+    def test_load_config_is_read_only(self):
+        cfg = load_config("finder.json")
+        with self.assertRaises(TypeError):
+            cfg["dialect"] = "mutated"
+        with self.assertRaises(TypeError):
+            cfg["output"]["indent"] = 99
+        self.assertNotEqual(load_config("finder.json")["output"]["indent"], 99)
+
+    def test_get_data_root_reads_loaded_config(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "global.json").write_text(
+                json.dumps({"live": {"data_root": "/srv/eewpw"}}), encoding="utf-8"
+            )
+            (root / "finder.json").write_text(json.dumps({"dialect": "scfinder"}), encoding="utf-8")
+
+            config_loader.set_config_root_override(root)
+            with mock.patch.dict(os.environ):
+                os.environ.pop("EEWPW_DATA_ROOT", None)
+                self.assertEqual(get_data_root(load_config("finder.json")), Path("/srv/eewpw"))
+
+    def test_load_config_follows_config_root_override(self):
+        default_indent = load_config("finder.json")["output"]["indent"]
+        default_patterns = load_profile("finder_time_vs_mag.json")["patterns"]
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            (root / "profiles").mkdir()
+            (root / "global.json").write_text(json.dumps({"output": {"indent": 7}}), encoding="utf-8")
+            (root / "finder.json").write_text(json.dumps({"dialect": "scfinder"}), encoding="utf-8")
+            (root / "profiles" / "finder_time_vs_mag.json").write_text(
+                json.dumps({"patterns": {"1": "custom"}}), encoding="utf-8"
+            )
+
+            config_loader.set_config_root_override(root)
+            self.assertEqual(load_config("finder.json")["output"]["indent"], 7)
+            self.assertEqual(load_profile("finder_time_vs_mag.json")["patterns"], {"1": "custom"})
+
+            config_loader.set_config_root_override(None)
+            with mock.patch.dict(os.environ, {"EEWPW_PARSER_CONFIG_ROOT": td}):
+                self.assertEqual(load_config("finder.json")["output"]["indent"], 7)
+
+        self.assertEqual(load_config("finder.json")["output"]["indent"], default_indent)
+        self.assertEqual(load_profile("finder_time_vs_mag.json")["patterns"], default_patterns)
+
+    def test_apply_cli_overrides_leaves_cached_config_untouched(self):
+        args = argparse.Namespace(algo="finder", dialect="native_finder", verbose=True)
+        cfg = apply_cli_overrides(load_config("finder.json"), args)
+        self.assertEqual(cfg["algo"], "finder")
+        self.assertEqual(cfg["dialect"], "native_finder")
+        self.assertTrue(cfg["verbose"])
+        self.assertNotEqual(load_config("finder.json").get("dialect"), "native_finder")
+
+        args = argparse.Namespace(algo="finder", dialect=None, verbose=False)
+        cfg = apply_cli_overrides(load_config("finder.json"), args)
+        self.assertEqual(cfg.get("dialect"), load_config("finder.json").get("dialect"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import json
 import sys
 import unittest
 from pathlib import Path
@@ -7,6 +8,7 @@ sys.path.insert(0, str(ROOT / "src"))
 
 from eewpw_parser.parsers.vs.vs_parser import VSParser
 from eewpw_parser.dedup import (
+    dedup_key,
     deduplicate_detections,
     deduplicate_annotations,
 )
@@ -117,6 +119,35 @@ class TestDedup(unittest.TestCase):
         self.assertEqual(out[0], a1)
         self.assertEqual(out[1], a3)
 
+    def test_memoized_key_reset_on_assignment_and_copy(self):
+        a1 = Annotation(
+            timestamp="2020-01-01T00:00:00Z",
+            pattern="p",
+            line="1",
+            text="line1",
+            pattern_id="pid",
+        )
+        k1 = dedup_key(a1)
+        self.assertEqual(dedup_key(a1), k1)
+
+        a2 = a1.copy(update={"text": "line2"})
+        self.assertNotEqual(dedup_key(a2), k1)
+
+        a1.text = "line2"
+        self.assertEqual(dedup_key(a1), dedup_key(a2))
+
+    def test_payload_json_matches_dict_and_resets(self):
+        a1 = Annotation(
+            timestamp="2020-01-01T00:00:00Z",
+            pattern="p",
+            line="1",
+            text="line1",
+            pattern_id="pid",
+        )
+        self.assertEqual(json.loads(a1.payload_json()), a1.dict())
+        a1.text = "line2"
+        self.assertEqual(json.loads(a1.payload_json())["text"], "line2")
+
 
 if __name__ == "__main__":
     unittest.main()
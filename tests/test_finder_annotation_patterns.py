@@ -0,0 +1,57 @@
+import re
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from eewpw_parser.parsers.finder.dialects import FinderStreamState, SCFinderDialect
+
+
+PATTERNS = {
+    "timestamp_regex": r"(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2})",
+    "anchored": "length has increased",
+    "alt": "foo|bar",
+    "digits": r"\d{3}[xy]",
+    "grouped": r"(q)\1z",
+}
+
+LINES = [
+    "2020/01/01 00:00:00 [notice/Application] length has increased",
+    "2020/01/01 00:00:01 [notice/Application] bar and 123x",
+    "2020/01/01 00:00:02 [notice/Application] qqz",
+    "2020/01/01 00:00:03 [notice/Application] nothing here",
+]
+
+
+class TestFinderAnnotationPatterns(unittest.TestCase):
+    def test_matches_agree_with_plain_search(self):
+        dialect = SCFinderDialect()
+        dialect._profile_cache = {"patterns": PATTERNS}
+        ann = dialect._parse_annotations_stream(LINES, FinderStreamState())
+
+        expected = [
+            (str(idx + 1), pid)
+            for idx, line in enumerate(LINES)
+            for pid, pat in PATTERNS.items()
+            if pid != "timestamp_regex" and re.search(pat, line)
+        ]
+        self.assertEqual([(a.line, a.pattern_id) for a in ann], expected)
+        self.assertIsNotNone(dialect._annotation_gate)
+
+    def test_playback_time_uses_subclass_marker(self):
+        class FinderStartedDialect(SCFinderDialect):
+            START_PLAYBACK_RE = re.compile(r"^(\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}) \[notice/Application\] Finder started")
+
+        dialect = FinderStartedDialect()
+        dialect._profile_cache = {"patterns": {}}
+        state = FinderStreamState()
+        dialect._parse_annotations_stream(
+            LINES[:1] + ["2020/01/01 00:00:05 [notice/Application] Finder started"], state
+        )
+        self.assertEqual(state.playback_time_iso, "2020-01-01T00:00:05Z")
+
+
+if __name__ == "__main__":
+    unittest.main()
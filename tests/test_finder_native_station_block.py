@@ -6,6 +6,7 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT / "src"))
 
+from eewpw_parser.parsers.finder.dialects import FinderStreamState, NativeFinderDialect
 from eewpw_parser.parsers.finder.finder_parser import FinderParser
 
 
@@ -32,6 +33,17 @@ event_id = 1764837231
 -> get_origin_time = 1577836800
 """
 
+NATIVE_TWO_EVENTS_WITH_STATIONS = NATIVE_DETECTION_THEN_STATIONS + """\
+SY.TOFC.ENE.-- 49.254/-125.808 -- 512 1577836819.100 include = 1
+SY.TOFD.ENE.-- 49.354/-125.708 -- 256 1577836820.200 include = 1
+event_id = 1764837232
+-> get_mag = 4.1
+-> get_epicenter_lat = 48.0
+-> get_epicenter_lon = -124.9
+-> get_depth = 8.0
+-> get_origin_time = 1577836900
+"""
+
 
 class TestFinderNativeStationBlock(unittest.TestCase):
     def _parse_native(self, content: str):
@@ -65,6 +77,25 @@ class TestFinderNativeStationBlock(unittest.TestCase):
         self.assertEqual(len(pga_obs), 1)
         self.assertEqual(pga_obs[0].SNCL, "SY.TOFB.ENE.--")
 
+    def test_stream_chunking_does_not_change_station_attachment(self):
+        with tempfile.TemporaryDirectory() as td:
+            log_path = Path(td) / "finder_native.log"
+            log_path.write_text(NATIVE_TWO_EVENTS_WITH_STATIONS, encoding="utf-8")
+            expected = [d.dict() for d in NativeFinderDialect().parse_file(str(log_path))[0]]
+        self.assertEqual(len(expected[0]["gm_info"]["pga_obs"]), 3)
+        self.assertEqual(expected[1]["gm_info"]["pga_obs"], [])
+
+        lines = NATIVE_TWO_EVENTS_WITH_STATIONS.splitlines(True)
+        # Chunk sizes that split the station block at different rows.
+        for size in (1, 2, 3, 8, 9, 10):
+            worker = NativeFinderDialect()
+            state = FinderStreamState()
+            dets = []
+            for k in range(0, len(lines), size):
+                dets += worker.parse_stream(lines[k:k + size], state, finalize=False)[0]
+            dets += worker.parse_stream([], state, finalize=True)[0]
+            self.assertEqual([d.dict() for d in dets], expected, msg=f"chunk size {size}")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,65 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from eewpw_parser.parsers.finder import dialects
+from eewpw_parser.parsers.finder.dialects import ShakeAlertFinderDialect
+
+
+SHAKEALERT_LOG = """\
+00:00:03.1 | INFO | 2025-11-07 00:00:03:081 processing length has increased
+00:00:03.2 | DEBUG | <event_message category="live" instance="finder@x" orig_sys="finder" timestamp="2025-11-07T00:00:03.000Z" version="0">
+00:00:03.2 | DEBUG | <core_info id="903"><mag>4.3</mag><lat>34.3</lat><lon>-118.3</lon><depth>8.0</depth><likelihood>0.8</likelihood><orig_time>2025-11-07T00:00:00.000Z</orig_time></core_info><fault_info><finite_fault><segment><vertices><vertex><lat>34.1</lat><lon>-118.1</lon><depth>0</depth></vertex><vertex>
+00:00:03.2 | DEBUG | <lat>34.2</lat><lon>-118.2</lon><depth>bad</depth></vertex></vertices></segment></finite_fault></fault_info><gm_info><gmpoint_obs><pga_obs><obs><SNCL> CI.A.HNZ.-- </SNCL><value>0.5</value><lat>34</lat><lon>-118</lon><time> 2025-11-07T00:00:01Z </time></obs><obs><SNCL>CI.B</SNCL><value>x</value></obs></pga_obs></gmpoint_obs></gm_info></event_message>
+00:00:05.1 | INFO | 2025-11-07 00:00:05:081 processing length has increased
+00:00:05.2 | DEBUG | <event_message category="live" instance="finder@x" orig_sys="finder" timestamp="2025-11-07T00:00:05.000Z" version="2">
+00:00:05.2 | DEBUG | <core_info id="901"><mag>4.5</mag><lat>34.5</lat><lon>-118.5</lon><depth>8.0</depth><orig_time>2025-11-07T00:00:00.000Z</orig_time></core_info><gm_info><gmpoint_obs><pga_obs>
+00:00:05.2 | DEBUG | <obs><SNCL>CI.B</SNCL><value>0.7</value></obs></pga_obs></gmpoint_obs></gm_info></event_message>
+"""
+
+
+class TestFinderShakeAlertXml(unittest.TestCase):
+    def _parse(self):
+        with tempfile.TemporaryDirectory() as td:
+            log_path = Path(td) / "shakealert.log"
+            log_path.write_text(SHAKEALERT_LOG, encoding="utf-8")
+            dets, _, _ = ShakeAlertFinderDialect().parse_file(str(log_path))
+        return [d.dict() for d in dets]
+
+    def _check(self, dets):
+        self.assertEqual([(d["event_id"], d["version"]) for d in dets], [("903", "0"), ("901", "2")])
+
+        first = dets[0]
+        self.assertEqual(first["timestamp"], "2025-11-07T00:00:03.000Z")
+        self.assertEqual(first["core_info"]["mag"], "4.3")
+        self.assertEqual(first["core_info"]["likelihood"], "0.8")
+        # The vertex with a malformed depth is skipped.
+        self.assertEqual(first["fault_info"], [{"lat": "34.1", "lon": "-118.1", "depth": "0.0"}])
+        # So is the observation with a malformed value.
+        pga = first["gm_info"]["pga_obs"]
+        self.assertEqual(len(pga), 1)
+        self.assertEqual(pga[0]["SNCL"], "CI.A.HNZ.--")
+        self.assertEqual((pga[0]["value"], pga[0]["lat"], pga[0]["lon"]), ("0.5", "34.0", "-118.0"))
+        self.assertEqual(pga[0]["time"], "2025-11-07T00:00:01Z")
+
+        second = dets[1]
+        self.assertEqual(second["fault_info"], [])
+        pga = second["gm_info"]["pga_obs"]
+        self.assertEqual([(o["SNCL"], o["value"], o["lat"], o["lon"]) for o in pga], [("CI.B", "0.7", "0.0", "0.0")])
+
+    def test_event_messages_stdlib_backend(self):
+        with mock.patch.object(dialects, "lxml_etree", None):
+            self._check(self._parse())
+
+    @unittest.skipUnless(dialects.lxml_etree is not None, "lxml not installed")
+    def test_event_messages_lxml_backend(self):
+        self._check(self._parse())
+
+
+if __name__ == "__main__":
+    unittest.main()
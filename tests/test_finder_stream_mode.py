@@ -1,4 +1,5 @@
 import json
+import multiprocessing
 import sys
 import tempfile
 import unittest
@@ -7,6 +8,8 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT / "src"))
 
+from eewpw_parser import config_loader
+from eewpw_parser.parsers.finder.dialects import SCFinderDialect, _read_log_lines
 from eewpw_parser.parsers.finder.finder_parser import FinderParser
 from eewpw_parser.sinks import JsonlStreamSink
 
@@ -48,6 +51,63 @@ class TestFinderStreamMode(unittest.TestCase):
             self.assertIsNotNone(doc)
             self.assertEqual(len(doc.detections), 1)
 
+    def test_parse_files_matches_parse_file(self):
+        with tempfile.TemporaryDirectory() as td:
+            paths = []
+            for k in range(3):
+                log_path = Path(td) / f"finder{k}.log"
+                log_path.write_text(SYNTH_LOG_CONTENT.replace("= 1\n", f"= {k + 1}\n", 1), encoding="utf-8")
+                paths.append(str(log_path))
+            worker = SCFinderDialect()
+            single = [worker.parse_file(p) for p in paths]
+            for max_workers in (None, 2):
+                batched = list(worker.parse_files(paths, max_workers=max_workers))
+                self.assertEqual(len(batched), 3)
+                for (d1, a1, x1), (d2, a2, x2) in zip(batched, single):
+                    self.assertEqual([d.dict() for d in d1], [d.dict() for d in d2])
+                    self.assertEqual(x1, x2)
+                self.assertEqual([x["file"] for _, _, x in batched], paths)
+
+    def test_parse_files_spawn_workers_use_config_root_override(self):
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td) / "configs"
+            (root / "profiles").mkdir(parents=True)
+            (root / "profiles" / "finder_time_vs_mag.json").write_text(
+                json.dumps({"patterns": {"1": "custom marker"}}), encoding="utf-8"
+            )
+            paths = []
+            for k in range(2):
+                log_path = Path(td) / f"finder{k}.log"
+                log_path.write_text(
+                    SYNTH_LOG_CONTENT + f"2020/01/01 00:00:0{k + 6} [notice/Application] custom marker {k}\n",
+                    encoding="utf-8",
+                )
+                paths.append(str(log_path))
+
+            config_loader.set_config_root_override(root)
+            try:
+                worker = SCFinderDialect()
+                single = [worker.parse_file(p) for p in paths]
+                spawned = list(
+                    worker.parse_files(paths, max_workers=2, mp_context=multiprocessing.get_context("spawn"))
+                )
+            finally:
+                config_loader.set_config_root_override(None)
+
+            for (_, a1, _), (_, a2, _) in zip(spawned, single):
+                self.assertEqual(len(a1), 1)
+                self.assertEqual([a.dict() for a in a1], [a.dict() for a in a2])
+
+    def test_read_log_lines_matches_text_mode(self):
+        samples = [b"a\nb\nc", b"a\r\nb\rc\n", b"a\x0cb\nc\n", "\u00e9t\u00e9\nx\n".encode("utf-8") + b"\xff\n"]
+        with tempfile.TemporaryDirectory() as td:
+            log_path = Path(td) / "finder.log"
+            for raw in samples:
+                log_path.write_bytes(raw)
+                with open(log_path, "r", encoding="utf-8", errors="ignore") as f:
+                    expected = list(f)
+                self.assertEqual(_read_log_lines(str(log_path)), expected)
+
 
 if __name__ == "__main__":
     unittest.main()
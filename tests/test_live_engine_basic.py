@@ -1,5 +1,7 @@
+import errno
 import json
 import tempfile
+import time
 import unittest
 from pathlib import Path
 import sys
@@ -8,8 +10,11 @@ ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(ROOT / "src"))
 
 from eewpw_parser.live_engine import LiveEngine
-from eewpw_parser.sources import TailLineSource
+from eewpw_parser.live_writer import FLUSH_INTERVAL_S
+from eewpw_parser.sources import LineSource, ReplayLineSource, TailLineSource
 from eewpw_parser.parsers.vs.dialects import VSDialect
+from eewpw_parser.parsers.finder.finder_parser import FinderParser
+from eewpw_parser.config import load_config
 
 
 def write_vs_lines(p: Path):
@@ -22,6 +27,37 @@ def write_vs_lines(p: Path):
     p.write_text("".join(lines), encoding="utf-8")
 
 
+def write_finder_lines(p: Path):
+    lines = []
+    for k, (eid, ts) in enumerate([("1000", "00:00:00"), ("1001", "00:00:05"), ("1002", "00:00:10")]):
+        lines += [
+            f"2020/10/25 {ts} [info/Finder] event_id = {eid}\n",
+            f"2020/10/25 {ts} [info/Finder] -> get_mag = 3.{k}\n",
+            f"2020/10/25 {ts} [info/Finder] -> get_epicenter_lat = 46.{k}\n",
+            f"2020/10/25 {ts} [info/Finder] -> get_epicenter_lon = 7.{k}\n",
+            f"2020/10/25 {ts} [info/Finder] -> get_depth = 10.0\n",
+        ]
+        if eid == "1001":
+            lines.append("2020/10/25 00:00:06 [info/Finder] length has increased\n")
+    # A trailing event closes 1002 inside the same batch.
+    lines.append("2020/10/25 00:00:15 [info/Finder] event_id = 1003\n")
+    p.write_text("".join(lines), encoding="utf-8")
+
+
+class PausingLineSource(LineSource):
+    """Yields the first lines, goes idle for a while, then yields the rest."""
+
+    def __init__(self, before, after, pause_s):
+        self.before = before
+        self.after = after
+        self.pause_s = pause_s
+
+    def __iter__(self):
+        yield from self.before
+        time.sleep(self.pause_s)
+        yield from self.after
+
+
 class TestLiveEngineBasic(unittest.TestCase):
     def test_vs_engine_single_event(self):
         with tempfile.TemporaryDirectory() as td:
@@ -58,6 +94,100 @@ class TestLiveEngineBasic(unittest.TestCase):
                 self.assertIn("event_id", rec)
                 self.assertIn("timestamp", rec)
 
+    def test_finder_annotation_keeps_its_event_within_a_batch(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = Path(td) / "scfinder.log"
+            data_root = Path(td) / "data_root"
+            write_finder_lines(log)
+
+            cfg = dict(load_config())
+            cfg["dialect"] = "scfinder"
+            engine = LiveEngine(
+                source=ReplayLineSource([str(log)]),
+                parser=FinderParser(cfg),
+                data_root=data_root,
+                algo="finder",
+                dialect="scfinder",
+                instance="finder@test",
+                verbose=False,
+            )
+            engine.run_forever()
+
+            target = data_root / "live" / "raw" / "finder" / "2020-10-25_finder.jsonl"
+            parsed = [json.loads(l) for l in target.read_text(encoding="utf-8").splitlines()]
+            seq = [(r["record_type"], r["event_id"]) for r in parsed if r["record_type"] != "meta"]
+            self.assertEqual(
+                seq,
+                [
+                    ("detection", "1000"),
+                    ("detection", "1001"),
+                    ("annotation", "1001"),
+                    ("detection", "1002"),
+                ],
+            )
+
+    def test_idle_flush_failure_is_raised(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = Path(td) / "vs.log"
+            write_vs_lines(log)
+            lines = log.read_text(encoding="utf-8").splitlines(True)
+            source = PausingLineSource(lines, lines, pause_s=FLUSH_INTERVAL_S * 3)
+            engine = LiveEngine(
+                source=source,
+                parser=VSDialect(),
+                data_root=Path(td) / "data_root",
+                algo="vs",
+                dialect="scvsmag",
+                instance="vs@test",
+                verbose=False,
+            )
+
+            writer = engine._daily_writer
+            real_flush = writer.flush
+            calls = []
+
+            def failing_flush(*args, **kwargs):
+                calls.append(1)
+                if len(calls) == 1:
+                    raise OSError("transient flush failure")
+                return real_flush(*args, **kwargs)
+
+            writer.flush = failing_flush
+            with self.assertRaises(OSError):
+                engine.run_forever()
+
+    def test_writer_failure_still_closes_daily_file(self):
+        with tempfile.TemporaryDirectory() as td:
+            log = Path(td) / "vs.log"
+            write_vs_lines(log)
+            engine = LiveEngine(
+                source=TailLineSource(str(log), poll_interval=0.01, seek_end=False, follow=False),
+                parser=VSDialect(),
+                data_root=Path(td) / "data_root",
+                algo="vs",
+                dialect="scvsmag",
+                instance="vs@test",
+                verbose=False,
+            )
+
+            writer = engine._daily_writer
+            real_write_many = writer.write_many
+            handles = []
+
+            def full_disk_write_many(records):
+                real_write_many(records)
+                handles.append(writer._fh)
+                raise OSError(errno.ENOSPC, "No space left on device")
+
+            writer.write_many = full_disk_write_many
+            with self.assertRaises(OSError):
+                engine.run_forever()
+
+            self.assertTrue(engine._closed)
+            self.assertIsNone(writer._fh)
+            self.assertTrue(handles)
+            self.assertTrue(all(fh.closed for fh in handles))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import json
 import tempfile
 import unittest
 from pathlib import Path
@@ -46,6 +47,39 @@ class TestLiveRotation(unittest.TestCase):
             self.assertIn("2025-11-25_vs.jsonl", files)
             self.assertEqual(len(files), 2)
 
+    def test_write_many_splits_batch_by_day(self):
+        with tempfile.TemporaryDirectory() as td:
+            data_root = Path(td)
+            writer = DailyAlgoWriter(data_root, algo="vs", dialect="scvsmag", instance="vs@test", verbose=False)
+
+            det1 = Detection(
+                timestamp="2025-11-24T23:59:59Z",
+                event_id="EVT1",
+                category="live",
+                instance="vs@test",
+                orig_sys="vs",
+                version="1",
+                core_info=DetectionCore(
+                    id="EVT1",
+                    mag="4.1",
+                    lat="0.0",
+                    lon="0.0",
+                    depth="5.0",
+                    orig_time="2025-11-24T23:59:50Z",
+                ),
+            )
+            det2 = det1.copy(update={"timestamp": "2025-11-25T00:00:01Z", "version": "2"})
+            det3 = det1.copy(update={"timestamp": "2025-11-25T00:00:02Z", "version": "3"})
+
+            writer.write_many([writer.detection_record(d) for d in (det1, det2, det3)])
+            writer.close()
+
+            target_dir = data_root / "live" / "raw" / "vs"
+            day1 = (target_dir / "2025-11-24_vs.jsonl").read_text(encoding="utf-8").splitlines()
+            day2 = (target_dir / "2025-11-25_vs.jsonl").read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(l)["payload"]["version"] for l in day1], ["1"])
+            self.assertEqual([json.loads(l)["payload"]["version"] for l in day2], ["2", "3"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -46,6 +46,7 @@ class TestLiveWriterOrdering(unittest.TestCase):
 
             w.write_detection(det1)
             w.write_detection(det2)
+            w.flush()
 
             # File should be flushed and contain two lines in order
             lines = p.read_text(encoding="utf-8").strip().splitlines()
@@ -0,0 +1,33 @@
+import re
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from eewpw_parser.utils import required_literal
+
+
+class TestRequiredLiteral(unittest.TestCase):
+    def test_plain_and_partial_literals(self):
+        self.assertEqual(required_literal("length has increased"), "length has increased")
+        self.assertEqual(required_literal(r"\bevent_id\s*=\s*(\d+)"), "event_id")
+        self.assertEqual(required_literal(r"ab?cd"), "cd")
+
+    def test_no_anchor_when_not_guaranteed(self):
+        self.assertIsNone(required_literal("foo|bar"))
+        self.assertIsNone(required_literal("(?i)length"))
+        self.assertIsNone(required_literal(r"\d+"))
+        self.assertIsNone(required_literal("("))
+
+    def test_anchor_never_rejects_a_match(self):
+        pattern = r"x[0-9]+yz\d"
+        anchor = required_literal(pattern)
+        for line in ("x12yz3", "pre x1yz9 post"):
+            self.assertIsNotNone(re.search(pattern, line))
+            self.assertIn(anchor, line)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -55,6 +55,23 @@ class TestSources(unittest.TestCase):
             t.join()
             self.assertEqual(lines_out, ["line0\n", "line1\n", "line2\n", "line3\n"])
 
+    def test_batches_preserve_lines(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "batch.log"
+            lines = [f"line{i}\n" for i in range(70)]
+            p.write_text("".join(lines), encoding="utf-8")
+
+            replay = list(ReplayLineSource([str(p)]).iter_batches(32))
+            self.assertEqual([len(b) for b in replay], [32, 32, 6])
+            self.assertEqual(sum(replay, []), lines)
+
+            tail = list(TailLineSource(str(p), seek_end=False, follow=False).iter_batches(32))
+            self.assertEqual([len(b) for b in tail], [32, 32, 6])
+            self.assertEqual(sum(tail, []), lines)
+
+            capped = list(TailLineSource(str(p), seek_end=False, follow=False, max_lines=40).iter_batches(32))
+            self.assertEqual(sum(capped, []), lines[:40])
+
 
 if __name__ == "__main__":
     unittest.main()
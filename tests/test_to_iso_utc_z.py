@@ -0,0 +1,24 @@
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from eewpw_parser.utils import to_iso_utc_z
+
+
+class TestToIsoUtcZ(unittest.TestCase):
+    def test_plain_shapes(self):
+        self.assertEqual(to_iso_utc_z("2020/10/25 19:34:30"), "2020-10-25T19:34:30Z")
+        self.assertEqual(to_iso_utc_z("2024-08-14 06:29:23.003000"), "2024-08-14T06:29:23.003000Z")
+        self.assertEqual(to_iso_utc_z("2016-10-30T06:40:20.97Z"), "2016-10-30T06:40:20.970000Z")
+        self.assertEqual(to_iso_utc_z("2025-10-21 05:22:03:880"), "2025-10-21T05:22:03.880000Z")
+
+    def test_offsets_still_go_through_dateutil(self):
+        self.assertEqual(to_iso_utc_z("2016-10-30 06:40:20.97+03:00"), "2016-10-30T03:40:20.970000Z")
+        self.assertEqual(to_iso_utc_z("Oct 25 2020 19:34:30"), "2020-10-25T19:34:30Z")
+
+
+if __name__ == "__main__":
+    unittest.main()